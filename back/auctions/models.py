@@ -112,6 +112,7 @@ class Bid(models.Model):
             models.Index(fields=['auction', '-amount']),
             models.Index(fields=['bidder', 'auction']),
             models.Index(fields=['-created_at']),
+            models.Index(fields=['auction'], condition=models.Q(is_winning=True), name='bid_auction_winning'),
         ]
     
     def __str__(self):
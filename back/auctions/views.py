@@ -3,7 +3,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count, Max, Min
+from django.db.models import Q, F, Count, Max, Min
 from django.utils import timezone
 from django.db import transaction
 from datetime import timedelta
@@ -103,9 +103,9 @@ class AuctionDetailAPIView(generics.RetrieveAPIView):
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         
-        # Increment view count
+        # Increment view count in the database; bump the loaded copy for the response
+        Auction.objects.filter(pk=instance.pk).update(views_count=F('views_count') + 1)
         instance.views_count += 1
-        instance.save(update_fields=['views_count'])
         
         # Check and update auction status
         if instance.status == 'active':
@@ -139,7 +139,8 @@ class PlaceBidAPIView(APIView):
     
     @transaction.atomic
     def post(self, request, auction_id):
-        auction = get_object_or_404(Auction, id=auction_id)
+        # Lock the auction row so concurrent bids validate against the latest current_bid
+        auction = get_object_or_404(Auction.objects.select_for_update(), id=auction_id)
         
         # Validate auction is active
         if not auction.is_active():
@@ -229,7 +230,9 @@ class PlaceBidAPIView(APIView):
             if time_remaining < timedelta(minutes=auction.extend_minutes):
                 auction.extended_time = timezone.now() + timedelta(minutes=auction.extend_minutes)
         
-        auction.save()
+        auction.save(update_fields=[
+            'current_bid', 'total_bids', 'unique_bidders', 'extended_time', 'updated_at'
+        ])
         
         # Handle proxy bidding for other users
         if auction.allow_proxy_bidding:
@@ -270,7 +273,7 @@ class PlaceBidAPIView(APIView):
             # Update auction
             auction.current_bid = auto_bid_amount
             auction.total_bids += 1
-            auction.save()
+            auction.save(update_fields=['current_bid', 'total_bids', 'updated_at'])
             
             # Update winning status
             new_bid.is_winning = False
@@ -20,6 +20,7 @@ DJANGO_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.gis',
+    'django.contrib.postgres',
 ]
 
 THIRD_PARTY_APPS = [
@@ -248,6 +249,14 @@ CACHES = {
     }
 }
 
+if DEBUG:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'TIMEOUT': 300,
+        }
+    }
+
 # Custom User Model
 AUTH_USER_MODEL = 'accounts.User'
 
@@ -51,7 +51,8 @@ class Notification(models.Model):
         verbose_name_plural = _('Notifications')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['user', 'is_read']),
+            models.Index(fields=['user', 'is_read', '-created_at']),
+            models.Index(fields=['user', '-created_at']),
             models.Index(fields=['-created_at']),
         ]
     
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from properties.models import Property, refresh_primary_image_url
+
+
+class Command(BaseCommand):
+    help = 'Recompute Property.primary_image_url from property images (backfill).'
+
+    def handle(self, *args, **options):
+        count = 0
+        for property_id in Property.objects.values_list('pk', flat=True).iterator():
+            refresh_primary_image_url(property_id)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f'Refreshed primary image URLs for {count} properties'))
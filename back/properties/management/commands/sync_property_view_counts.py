@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from properties.models import Property, PropertyView
+
+
+class Command(BaseCommand):
+    help = (
+        'Roll PropertyView rows up into Property.views_count; run every minute '
+        '(the view-counts service in docker-compose.yml does this).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Recount every property')
+        parser.add_argument(
+            '--window', type=int, default=5,
+            help='Recount properties viewed in the last N minutes (default 5)'
+        )
+
+    def handle(self, *args, **options):
+        properties = Property.objects.all()
+        if not options['full']:
+            # Counts are recomputed, not incremented, so overlapping windows are
+            # harmless and a few missed runs are caught up without stored state
+            since = timezone.now() - timedelta(minutes=options['window'])
+            properties = properties.filter(
+                pk__in=PropertyView.objects.filter(created_at__gte=since).values('property_id')
+            )
+
+        view_counts = PropertyView.objects.filter(
+            property=OuterRef('pk')
+        ).order_by().values('property').annotate(total=Count('id')).values('total')
+
+        updated = properties.update(views_count=Coalesce(Subquery(view_counts), 0))
+
+        self.stdout.write(self.style.SUCCESS(f'Synced view counts for {updated} properties'))
@@ -0,0 +1,312 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:08
+
+import django.contrib.gis.db.models.fields
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AmenityCategory',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, verbose_name='name')),
+                ('slug', models.SlugField(unique=True, verbose_name='slug')),
+                ('category_type', models.CharField(choices=[('basic', 'Basic Amenities'), ('security', 'Security Features'), ('leisure', 'Leisure & Recreation'), ('accessibility', 'Accessibility'), ('smart', 'Smart Home Features'), ('outdoor', 'Outdoor Features'), ('parking', 'Parking & Storage'), ('utilities', 'Utilities')], max_length=20, verbose_name='type')),
+                ('icon', models.CharField(blank=True, help_text='Icon class name', max_length=50, verbose_name='icon')),
+                ('order', models.IntegerField(default=0, verbose_name='order')),
+                ('is_active', models.BooleanField(default=True, verbose_name='is active')),
+            ],
+            options={
+                'verbose_name': 'Amenity Category',
+                'verbose_name_plural': 'Amenity Categories',
+                'db_table': 'amenity_categories',
+                'ordering': ['order', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Amenity',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, verbose_name='name')),
+                ('slug', models.SlugField(unique=True, verbose_name='slug')),
+                ('description', models.CharField(blank=True, max_length=255, verbose_name='description')),
+                ('icon', models.CharField(blank=True, max_length=50, verbose_name='icon')),
+                ('is_premium', models.BooleanField(default=False, verbose_name='is premium')),
+                ('is_searchable', models.BooleanField(default=True, verbose_name='is searchable')),
+                ('applicable_property_types', models.JSONField(default=list, help_text='List of property types this amenity applies to', verbose_name='applicable property types')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='amenities', to='properties.amenitycategory')),
+            ],
+            options={
+                'verbose_name': 'Amenity',
+                'verbose_name_plural': 'Amenities',
+                'db_table': 'amenities',
+                'ordering': ['category', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Property',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255, verbose_name='title')),
+                ('slug', models.SlugField(max_length=255, unique=True, verbose_name='slug')),
+                ('description', models.TextField(verbose_name='description')),
+                ('property_type', models.CharField(choices=[('apartment', 'Apartment'), ('villa', 'Villa'), ('office', 'Office'), ('shop', 'Shop'), ('warehouse', 'Warehouse'), ('land', 'Land'), ('building', 'Building'), ('farm', 'Farm')], max_length=20, verbose_name='property type')),
+                ('purpose', models.CharField(choices=[('sale', 'For Sale'), ('rent', 'For Rent'), ('auction', 'For Auction')], max_length=20, verbose_name='purpose')),
+                ('status', models.CharField(choices=[('available', 'Available'), ('sold', 'Sold'), ('rented', 'Rented'), ('auction', 'In Auction'), ('pending', 'Pending'), ('unavailable', 'Unavailable')], default='available', max_length=20, verbose_name='status')),
+                ('reference_number', models.CharField(max_length=50, unique=True, verbose_name='reference number')),
+                ('address', models.TextField(verbose_name='address')),
+                ('city', models.CharField(max_length=100, verbose_name='city')),
+                ('district', models.CharField(max_length=100, verbose_name='district')),
+                ('country', models.CharField(default='Saudi Arabia', max_length=100, verbose_name='country')),
+                ('postal_code', models.CharField(blank=True, max_length=20, verbose_name='postal code')),
+                ('latitude', models.FloatField(blank=True, db_index=True, null=True, verbose_name='latitude')),
+                ('longitude', models.FloatField(blank=True, db_index=True, null=True, verbose_name='longitude')),
+                ('location', django.contrib.gis.db.models.fields.PointField(blank=True, null=True, verbose_name='location')),
+                ('location_accuracy', models.CharField(choices=[('exact', 'Exact'), ('approximate', 'Approximate'), ('area', 'Area Only')], default='exact', max_length=20, verbose_name='location accuracy')),
+                ('map_zoom_level', models.IntegerField(default=15, verbose_name='map zoom level')),
+                ('nearby_places', models.JSONField(blank=True, default=dict, verbose_name='nearby places')),
+                ('area_sqm', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='area (sqm)')),
+                ('bedrooms', models.IntegerField(default=0, verbose_name='bedrooms')),
+                ('bathrooms', models.IntegerField(default=0, verbose_name='bathrooms')),
+                ('parking_spaces', models.IntegerField(default=0, verbose_name='parking spaces')),
+                ('floor_number', models.IntegerField(blank=True, null=True, verbose_name='floor number')),
+                ('total_floors', models.IntegerField(blank=True, null=True, verbose_name='total floors')),
+                ('year_built', models.IntegerField(blank=True, null=True, verbose_name='year built')),
+                ('price', models.DecimalField(decimal_places=2, max_digits=12, verbose_name='price')),
+                ('price_per_sqm', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='price per sqm')),
+                ('currency', models.CharField(default='SAR', max_length=3, verbose_name='currency')),
+                ('is_negotiable', models.BooleanField(default=False, verbose_name='is negotiable')),
+                ('features', models.JSONField(blank=True, default=list, verbose_name='features')),
+                ('meta_title', models.CharField(blank=True, max_length=255, verbose_name='meta title')),
+                ('meta_description', models.TextField(blank=True, verbose_name='meta description')),
+                ('meta_keywords', models.TextField(blank=True, verbose_name='meta keywords')),
+                ('views_count', models.IntegerField(default=0, verbose_name='views count')),
+                ('favorites_count', models.IntegerField(default=0, verbose_name='favorites count')),
+                ('is_featured', models.BooleanField(default=False, verbose_name='is featured')),
+                ('is_verified', models.BooleanField(default=False, verbose_name='is verified')),
+                ('is_published', models.BooleanField(default=True, verbose_name='is published')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('published_at', models.DateTimeField(blank=True, null=True, verbose_name='published at')),
+                ('sold_at', models.DateTimeField(blank=True, null=True, verbose_name='sold at')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='properties', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Property',
+                'verbose_name_plural': 'Properties',
+                'db_table': 'properties',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PropertyAmenity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_available', models.BooleanField(default=True, verbose_name='is available')),
+                ('notes', models.CharField(blank=True, max_length=255, verbose_name='notes')),
+                ('verified', models.BooleanField(default=False, verbose_name='verified')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('amenity', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='property_amenities', to='properties.amenity')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='property_amenities', to='properties.property')),
+            ],
+            options={
+                'verbose_name': 'Property Amenity',
+                'verbose_name_plural': 'Property Amenities',
+                'db_table': 'property_amenities',
+            },
+        ),
+        migrations.CreateModel(
+            name='PropertyComparison',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(blank=True, max_length=100, verbose_name='comparison name')),
+                ('notes', models.TextField(blank=True, verbose_name='notes')),
+                ('is_active', models.BooleanField(default=True, verbose_name='is active')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('properties', models.ManyToManyField(related_name='in_comparisons', to='properties.property')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='property_comparisons', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Property Comparison',
+                'verbose_name_plural': 'Property Comparisons',
+                'db_table': 'property_comparisons',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PropertyDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('document', models.FileField(upload_to='properties/documents/', verbose_name='document')),
+                ('document_type', models.CharField(choices=[('deed', 'Property Deed'), ('contract', 'Contract'), ('plan', 'Floor Plan'), ('certificate', 'Certificate'), ('other', 'Other')], max_length=20, verbose_name='document type')),
+                ('title', models.CharField(max_length=255, verbose_name='title')),
+                ('description', models.TextField(blank=True, verbose_name='description')),
+                ('is_public', models.BooleanField(default=False, verbose_name='is public')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='documents', to='properties.property')),
+            ],
+            options={
+                'verbose_name': 'Property Document',
+                'verbose_name_plural': 'Property Documents',
+                'db_table': 'property_documents',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PropertyFavorite',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('notes', models.TextField(blank=True, verbose_name='notes')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='favorited_by', to='properties.property')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='favorite_properties', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Property Favorite',
+                'verbose_name_plural': 'Property Favorites',
+                'db_table': 'property_favorites',
+            },
+        ),
+        migrations.CreateModel(
+            name='PropertyImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='properties/images/', verbose_name='image')),
+                ('title', models.CharField(blank=True, max_length=255, verbose_name='title')),
+                ('is_primary', models.BooleanField(default=False, verbose_name='is primary')),
+                ('order', models.IntegerField(default=0, verbose_name='order')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='properties.property')),
+            ],
+            options={
+                'verbose_name': 'Property Image',
+                'verbose_name_plural': 'Property Images',
+                'db_table': 'property_images',
+                'ordering': ['order', 'created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PropertyView',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True, verbose_name='IP address')),
+                ('user_agent', models.TextField(blank=True, verbose_name='user agent')),
+                ('referrer', models.URLField(blank=True, verbose_name='referrer')),
+                ('view_duration', models.IntegerField(blank=True, null=True, verbose_name='view duration (seconds)')),
+                ('viewed_images', models.BooleanField(default=False, verbose_name='viewed images')),
+                ('viewed_documents', models.BooleanField(default=False, verbose_name='viewed documents')),
+                ('contacted_owner', models.BooleanField(default=False, verbose_name='contacted owner')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='property_views', to='properties.property')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Property View',
+                'verbose_name_plural': 'Property Views',
+                'db_table': 'property_views',
+            },
+        ),
+        migrations.CreateModel(
+            name='ViewingAppointment',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('requested_date', models.DateTimeField(verbose_name='requested date')),
+                ('confirmed_date', models.DateTimeField(blank=True, null=True, verbose_name='confirmed date')),
+                ('duration_minutes', models.IntegerField(default=30, verbose_name='duration (minutes)')),
+                ('status', models.CharField(choices=[('requested', 'Requested'), ('confirmed', 'Confirmed'), ('rescheduled', 'Rescheduled'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('no_show', 'No Show')], default='requested', max_length=20, verbose_name='status')),
+                ('contact_phone', models.CharField(max_length=20, verbose_name='contact phone')),
+                ('contact_email', models.EmailField(max_length=254, verbose_name='contact email')),
+                ('attendees_count', models.IntegerField(default=1, verbose_name='number of attendees')),
+                ('user_notes', models.TextField(blank=True, verbose_name='user notes')),
+                ('agent_notes', models.TextField(blank=True, verbose_name='agent notes')),
+                ('feedback', models.TextField(blank=True, verbose_name='feedback')),
+                ('interested', models.BooleanField(null=True, verbose_name='interested')),
+                ('is_virtual', models.BooleanField(default=False, verbose_name='is virtual viewing')),
+                ('meeting_link', models.URLField(blank=True, verbose_name='meeting link')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='viewing_appointments', to='properties.property')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='viewing_appointments', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Viewing Appointment',
+                'verbose_name_plural': 'Viewing Appointments',
+                'db_table': 'viewing_appointments',
+                'ordering': ['requested_date'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='amenity',
+            index=models.Index(fields=['slug'], name='amenities_slug_29d8c4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='amenity',
+            index=models.Index(fields=['is_searchable'], name='amenities_is_sear_5a88ed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['status', 'purpose', 'is_published'], name='properties_status_c922c4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['city', 'district'], name='properties_city_86970a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['property_type', 'status'], name='properties_propert_08af30_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['-created_at'], name='properties_created_2ede73_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['reference_number'], name='properties_referen_e1d9e2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['latitude', 'longitude'], name='properties_latitud_5ee5e3_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='propertyamenity',
+            unique_together={('property', 'amenity')},
+        ),
+        migrations.AddIndex(
+            model_name='propertyfavorite',
+            index=models.Index(fields=['user', '-created_at'], name='property_fa_user_id_bc1f11_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='propertyfavorite',
+            unique_together={('user', 'property')},
+        ),
+        migrations.AddIndex(
+            model_name='propertyview',
+            index=models.Index(fields=['property', '-created_at'], name='property_vi_propert_95ad3e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyview',
+            index=models.Index(fields=['user', '-created_at'], name='property_vi_user_id_fff7df_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='viewingappointment',
+            index=models.Index(fields=['status', 'requested_date'], name='viewing_app_status_2f1ddd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='viewingappointment',
+            index=models.Index(fields=['property', 'status'], name='viewing_app_propert_cedac5_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Turn price_per_sqm into a stored generated column.
+
+    Django cannot AlterField a regular column into a GeneratedField, so the
+    column is dropped and re-added; Postgres fills it from price and area_sqm.
+    """
+
+    dependencies = [
+        ('properties', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='property',
+            name='price_per_sqm',
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='price_per_sqm',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.F('price') / django.db.models.functions.comparison.NullIf('area_sqm', 0),
+                output_field=models.DecimalField(decimal_places=2, max_digits=10, null=True),
+                verbose_name='price per sqm',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['price_per_sqm'], name='properties_price_p_147a41_idx'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_primary_image_urls(apps, schema_editor):
+    # Same choice as properties.models.refresh_primary_image_url: the primary image, else the first
+    Property = apps.get_model('properties', 'Property')
+    PropertyImage = apps.get_model('properties', 'PropertyImage')
+    property_ids = PropertyImage.objects.order_by().values_list('property_id', flat=True).distinct()
+    for property_id in property_ids.iterator():
+        image = (
+            PropertyImage.objects.filter(property_id=property_id, is_primary=True).first() or
+            PropertyImage.objects.filter(property_id=property_id).first()
+        )
+        Property.objects.filter(pk=property_id).update(primary_image_url=image.image.url if image.image else '')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0002_price_per_sqm_generated'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='primary_image_url',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='primary image URL'),
+        ),
+        migrations.RunPython(copy_primary_image_urls, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['owner', '-created_at'], name='properties_owner_i_c52b01_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['property_type', '-created_at'], name='prop_pub_type_created'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['purpose', '-created_at'], name='prop_pub_purpose_created'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['price'], name='prop_pub_price'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('is_featured', True), ('is_published', True)), fields=['-created_at'], name='prop_pub_featured_created'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('title', 'description', 'address', 'reference_number', config='simple'), name='property_search_vector'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyview',
+            index=models.Index(fields=['created_at'], name='property_vi_created_152ebd_idx'),
+        ),
+    ]
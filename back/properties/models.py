@@ -1,11 +1,18 @@
 from django.contrib.gis.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.contrib.gis.geos import Point
+from django.db.models.functions import NullIf
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 from django.utils.text import slugify
 import uuid
 
 
+# Shared by the GIN expression index and the listing search so the planner matches them
+PROPERTY_SEARCH_VECTOR = SearchVector('title', 'description', 'address', 'reference_number', config='simple')
+
+
 class Property(models.Model):
     """Property model for real estate listings."""
     
@@ -76,7 +83,12 @@ class Property(models.Model):
     
     # Pricing
     price = models.DecimalField(_('price'), max_digits=12, decimal_places=2)
-    price_per_sqm = models.DecimalField(_('price per sqm'), max_digits=10, decimal_places=2, null=True, blank=True)
+    price_per_sqm = models.GeneratedField(
+        verbose_name=_('price per sqm'),
+        expression=models.F('price') / NullIf('area_sqm', 0),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2, null=True),
+        db_persist=True,
+    )
     currency = models.CharField(_('currency'), max_length=3, default='SAR')
     is_negotiable = models.BooleanField(_('is negotiable'), default=False)
     
@@ -90,6 +102,7 @@ class Property(models.Model):
     
     # Stats
     views_count = models.IntegerField(_('views count'), default=0)
+    primary_image_url = models.CharField(_('primary image URL'), max_length=500, blank=True, editable=False)
     favorites_count = models.IntegerField(_('favorites count'), default=0)
     
     # Flags
@@ -115,6 +128,14 @@ class Property(models.Model):
             models.Index(fields=['-created_at']),
             models.Index(fields=['reference_number']),
             models.Index(fields=['latitude', 'longitude']),
+            models.Index(fields=['price_per_sqm']),
+            models.Index(fields=['owner', '-created_at']),
+            # Public listing filters/sorts only ever read published rows
+            models.Index(fields=['property_type', '-created_at'], condition=models.Q(is_published=True), name='prop_pub_type_created'),
+            models.Index(fields=['purpose', '-created_at'], condition=models.Q(is_published=True), name='prop_pub_purpose_created'),
+            models.Index(fields=['price'], condition=models.Q(is_published=True), name='prop_pub_price'),
+            models.Index(fields=['-created_at'], condition=models.Q(is_published=True, is_featured=True), name='prop_pub_featured_created'),
+            GinIndex(PROPERTY_SEARCH_VECTOR, name='property_search_vector'),
         ]
     
     def save(self, *args, **kwargs):
@@ -133,16 +154,23 @@ class Property(models.Model):
         elif self.latitude and self.longitude and not self.location:
             self.location = Point(self.longitude, self.latitude, srid=4326)
         
-        # Calculate price per sqm
-        if self.price and self.area_sqm:
-            self.price_per_sqm = self.price / self.area_sqm
-        
         super().save(*args, **kwargs)
     
     def __str__(self):
         return self.title
 
 
+def refresh_primary_image_url(property_id):
+    """Copy the primary (else first) image URL onto the property."""
+    image = (
+        PropertyImage.objects.filter(property_id=property_id, is_primary=True).first() or
+        PropertyImage.objects.filter(property_id=property_id).first()
+    )
+    Property.objects.filter(pk=property_id).update(
+        primary_image_url=image.image.url if image and image.image else ''
+    )
+
+
 class PropertyImage(models.Model):
     """Images for properties."""
     
@@ -334,6 +362,7 @@ class PropertyView(models.Model):
         indexes = [
             models.Index(fields=['property', '-created_at']),
             models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['created_at']),
         ]
 
 
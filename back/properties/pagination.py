@@ -0,0 +1,20 @@
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+class CappedCountPaginator(Paginator):
+    """Stop counting at count_cap rows so deep result sets don't pay a full COUNT(*)."""
+    count_cap = 1000
+
+    @cached_property
+    def count(self):
+        return self.object_list.order_by()[:self.count_cap].count()
+
+
+class PropertyPagination(PageNumberPagination):
+    """Page number pagination whose total is capped at CappedCountPaginator.count_cap."""
+    django_paginator_class = CappedCountPaginator
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
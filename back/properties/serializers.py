@@ -84,11 +84,8 @@ class PropertyListSerializer(serializers.ModelSerializer):
         ]
     
     def get_primary_image(self, obj):
-        primary = obj.images.filter(is_primary=True).first()
-        if primary:
-            return primary.image.url if primary.image else None
-        first_image = obj.images.first()
-        return first_image.image.url if first_image and first_image.image else None
+        # Denormalized from PropertyImage by the properties signals
+        return obj.primary_image_url or None
 
 
 class PropertyDetailSerializer(PropertySerializer):
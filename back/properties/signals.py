@@ -0,0 +1,28 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import (
+    Amenity, AmenityCategory, Property, PropertyAmenity, PropertyDocument, PropertyImage,
+    refresh_primary_image_url
+)
+
+
+@receiver([post_save, post_delete], sender=AmenityCategory)
+@receiver([post_save, post_delete], sender=Amenity)
+def invalidate_amenity_cache(sender, **kwargs):
+    from .views import bump_amenity_cache_version
+    bump_amenity_cache_version()
+
+
+@receiver([post_save, post_delete], sender=PropertyImage)
+@receiver([post_save, post_delete], sender=PropertyDocument)
+@receiver([post_save, post_delete], sender=PropertyAmenity)
+def touch_property(sender, instance, **kwargs):
+    # Bumping updated_at moves the property detail cache key
+    Property.objects.filter(pk=instance.property_id).update(updated_at=timezone.now())
+
+
+@receiver([post_save, post_delete], sender=PropertyImage)
+def sync_primary_image_url(sender, instance, **kwargs):
+    refresh_primary_image_url(instance.property_id)
@@ -1,15 +1,18 @@
+import math
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count, Avg, Sum
-from django.contrib.gis.geos import Point
+from django.db.models import Q, F, Count, Avg, Sum, Prefetch
+from django.contrib.gis.geos import Point, Polygon
 from django.contrib.gis.db.models.functions import Distance
+from django.contrib.postgres.search import SearchQuery
 from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from .models import (
-    Property, PropertyImage, PropertyDocument, 
+    PROPERTY_SEARCH_VECTOR, Property, PropertyImage, PropertyDocument, 
     Amenity, AmenityCategory, PropertyAmenity,
     PropertyFavorite, PropertyView, PropertyComparison, ViewingAppointment
 )
@@ -19,11 +22,22 @@ from .serializers import (
     PropertyFavoriteSerializer, PropertyComparisonSerializer, 
     ViewingAppointmentSerializer
 )
+from .pagination import PropertyPagination
 from .permissions import IsOwnerOrReadOnly
 
 
+# Columns PropertyListSerializer reads; skips description, features, nearby_places, etc.
+PROPERTY_LIST_ONLY = (
+    'id', 'title', 'slug', 'property_type', 'purpose', 'status',
+    'city', 'district', 'area_sqm', 'bedrooms', 'bathrooms',
+    'price', 'currency', 'is_featured', 'latitude', 'longitude', 'created_at',
+    'primary_image_url', 'owner', 'owner__first_name', 'owner__last_name'
+)
+
+
 class PropertyListCreateAPIView(generics.ListCreateAPIView):
     """List all properties or create a new property."""
+    pagination_class = PropertyPagination
     
     def get_queryset(self):
         queryset = Property.objects.filter(is_published=True)
@@ -74,11 +88,9 @@ class PropertyListCreateAPIView(generics.ListCreateAPIView):
             queryset = queryset.filter(is_featured=True)
         
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search) |
-                Q(address__icontains=search) |
-                Q(reference_number__icontains=search)
+            # Full-text match served by the property_search_vector GIN index
+            queryset = queryset.annotate(search_vector=PROPERTY_SEARCH_VECTOR).filter(
+                search_vector=SearchQuery(search, config='simple', search_type='websearch')
             )
         
         if amenities:
@@ -90,7 +102,16 @@ class PropertyListCreateAPIView(generics.ListCreateAPIView):
         
         if lat and lng:
             point = Point(float(lng), float(lat), srid=4326)
-            queryset = queryset.filter(location__isnull=False).annotate(
+            # Bounding-box prefilter (served by the location GiST index) before
+            # the exact per-row distance check
+            lat_delta = float(radius) / 111.32
+            lng_delta = lat_delta / max(math.cos(math.radians(point.y)), 0.01)
+            bbox = Polygon.from_bbox((
+                point.x - lng_delta, point.y - lat_delta,
+                point.x + lng_delta, point.y + lat_delta
+            ))
+            bbox.srid = 4326
+            queryset = queryset.filter(location__bboverlaps=bbox).annotate(
                 distance=Distance('location', point)
             ).filter(distance__lte=float(radius) * 1000).order_by('distance')
         
@@ -105,9 +126,7 @@ class PropertyListCreateAPIView(generics.ListCreateAPIView):
         elif sort_by in ['price', '-price', 'area_sqm', '-area_sqm', 'created_at', '-created_at']:
             queryset = queryset.order_by(sort_by)
         
-        return queryset.select_related('owner').prefetch_related(
-            'images', 'property_amenities__amenity__category'
-        )
+        return queryset.select_related('owner').only(*PROPERTY_LIST_ONLY)
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -134,14 +153,21 @@ class PropertyListCreateAPIView(generics.ListCreateAPIView):
             )
 
 
+PROPERTY_DETAIL_CACHE_TIMEOUT = 600
+
+
 class PropertyRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update, or delete a property."""
-    queryset = Property.objects.all()
+    queryset = Property.objects.select_related('owner').prefetch_related(
+        'images', 'documents', 'property_amenities__amenity__category'
+    )
     serializer_class = PropertyDetailSerializer
     permission_classes = [IsOwnerOrReadOnly]
     
     def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
+        # Cheap lookup first; the prefetching queryset only runs on a cache miss
+        instance = get_object_or_404(Property.objects.only('id', 'updated_at'), pk=kwargs['pk'])
+        self.check_object_permissions(request, instance)
         
         # Track view
         ip_address = request.META.get('REMOTE_ADDR')
@@ -154,12 +180,18 @@ class PropertyRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView
             user_agent=user_agent
         )
         
-        # Increment view count
-        instance.views_count += 1
-        instance.save(update_fields=['views_count'])
+        # views_count is rolled up from PropertyView by sync_property_view_counts
+        
+        # updated_at in the key invalidates on every save (and on image,
+        # document and amenity changes, see signals)
+        cache_key = f'property_detail_{instance.pk}_{instance.updated_at.timestamp()}'
+        data = cache.get(cache_key)
+        
+        if data is None:
+            data = self.get_serializer(self.get_object()).data
+            cache.set(cache_key, data, PROPERTY_DETAIL_CACHE_TIMEOUT)
         
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        return Response(data)
 
 
 class MyPropertiesListAPIView(generics.ListAPIView):
@@ -168,7 +200,9 @@ class MyPropertiesListAPIView(generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        return Property.objects.filter(owner=self.request.user)
+        return Property.objects.filter(owner=self.request.user).select_related(
+            'owner'
+        ).only(*PROPERTY_LIST_ONLY)
 
 
 class PropertyStatisticsAPIView(APIView):
@@ -278,18 +312,46 @@ class PropertyAnalyticsAPIView(APIView):
 
 
 # Amenity Views
-class AmenityCategoryListAPIView(generics.ListAPIView):
+AMENITY_CACHE_VERSION_KEY = 'amenities_version'
+AMENITY_CACHE_TIMEOUT = 3600
+
+
+def bump_amenity_cache_version():
+    """Invalidate every cached amenity list by moving to a new key version."""
+    cache.add(AMENITY_CACHE_VERSION_KEY, 0, None)
+    cache.incr(AMENITY_CACHE_VERSION_KEY)
+
+
+class CachedAmenityListMixin:
+    """Cache the serialized list per version and query string."""
+    cache_prefix = None
+    
+    def list(self, request, *args, **kwargs):
+        version = cache.get(AMENITY_CACHE_VERSION_KEY, 0)
+        cache_key = f'{self.cache_prefix}_v{version}_{request.GET.urlencode()}'
+        data = cache.get(cache_key)
+        
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, AMENITY_CACHE_TIMEOUT)
+        
+        return Response(data)
+
+
+class AmenityCategoryListAPIView(CachedAmenityListMixin, generics.ListAPIView):
     """List all amenity categories."""
     queryset = AmenityCategory.objects.filter(is_active=True)
     serializer_class = AmenityCategorySerializer
     permission_classes = [AllowAny]
+    cache_prefix = 'amenity_categories'
 
 
-class AmenityListAPIView(generics.ListAPIView):
+class AmenityListAPIView(CachedAmenityListMixin, generics.ListAPIView):
     """List all amenities."""
     queryset = Amenity.objects.filter(is_searchable=True).select_related('category')
     serializer_class = AmenitySerializer
     permission_classes = [AllowAny]
+    cache_prefix = 'amenities'
     
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -314,21 +376,24 @@ class PropertyFavoriteToggleAPIView(APIView):
     permission_classes = [IsAuthenticated]
     
     def post(self, request, pk):
-        property_obj = get_object_or_404(Property, pk=pk)
+        # Try the removal first: a single DELETE decides which way the toggle goes
+        deleted, _ = PropertyFavorite.objects.filter(user=request.user, property_id=pk).delete()
         
-        favorite, created = PropertyFavorite.objects.get_or_create(
-            user=request.user,
-            property=property_obj
-        )
-        
-        if not created:
-            favorite.delete()
-            property_obj.favorites_count = max(0, property_obj.favorites_count - 1)
-            property_obj.save(update_fields=['favorites_count'])
+        if deleted:
+            Property.objects.filter(pk=pk, favorites_count__gt=0).update(
+                favorites_count=F('favorites_count') - 1
+            )
             return Response({'favorited': False, 'message': 'Removed from favorites'})
         
-        property_obj.favorites_count += 1
-        property_obj.save(update_fields=['favorites_count'])
+        property_obj = get_object_or_404(Property.objects.only('id'), pk=pk)
+        try:
+            with transaction.atomic():
+                PropertyFavorite.objects.create(user=request.user, property=property_obj)
+        except IntegrityError:
+            # A concurrent request already added it
+            return Response({'favorited': True, 'message': 'Added to favorites'})
+        
+        Property.objects.filter(pk=pk).update(favorites_count=F('favorites_count') + 1)
         return Response({'favorited': True, 'message': 'Added to favorites'})
 
 
@@ -340,7 +405,7 @@ class MyFavoritesListAPIView(generics.ListAPIView):
     def get_queryset(self):
         return PropertyFavorite.objects.filter(
             user=self.request.user
-        ).select_related('property').order_by('-created_at')
+        ).select_related('property__owner').order_by('-created_at')
 
 
 # Comparison Views
@@ -353,7 +418,12 @@ class PropertyComparisonListCreateAPIView(generics.ListCreateAPIView):
         return PropertyComparison.objects.filter(
             user=self.request.user,
             is_active=True
-        ).prefetch_related('properties')
+        ).prefetch_related(
+            Prefetch(
+                'properties',
+                queryset=Property.objects.select_related('owner')
+            )
+        )
     
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from subscriptions.models import Subscription, current_period_start
+
+
+class Command(BaseCommand):
+    help = 'Zero auctions_this_month on subscriptions still in a previous period; schedule for the first day of each month.'
+
+    def handle(self, *args, **options):
+        first_of_month = current_period_start()
+        updated = Subscription.objects.filter(period_start__lt=first_of_month).update(
+            auctions_this_month=0, period_start=first_of_month
+        )
+        self.stdout.write(self.style.SUCCESS(f'Reset auction counts on {updated} subscriptions'))
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+import stripe
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from subscriptions.models import Currency, PaymentHistory, PaymentStatus, Subscription
+
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = 'Backfill PaymentHistory from paid Stripe invoices; rows already recorded are skipped.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=7, help='How far back to fetch invoices')
+
+    def handle(self, *args, **options):
+        stripe.api_key = settings.STRIPE_SECRET_KEY
+        since = timezone.now() - timedelta(days=options['days'])
+
+        invoices = [
+            invoice for invoice in stripe.Invoice.list(
+                status='paid', created={'gte': int(since.timestamp())}, limit=100
+            ).auto_paging_iter()
+            if invoice.subscription and invoice.payment_intent
+        ]
+
+        # One query maps every Stripe subscription id in the batch to its local row
+        subscription_ids = dict(
+            Subscription.objects.filter(
+                stripe_subscription_id__in={invoice.subscription for invoice in invoices}
+            ).values_list('stripe_subscription_id', 'id')
+        )
+
+        payments = []
+        for invoice in invoices:
+            subscription_id = subscription_ids.get(invoice.subscription)
+            currency = Currency.__members__.get(invoice.currency.upper())
+            if subscription_id is None or currency is None:
+                continue
+            paid_at = invoice.status_transitions.paid_at
+            payments.append(PaymentHistory(
+                subscription_id=subscription_id,
+                stripe_payment_intent_id=invoice.payment_intent,
+                amount=Decimal(invoice.amount_paid) / 100,
+                currency=currency,
+                status=PaymentStatus.SUCCEEDED,
+                invoice_number=invoice.number or invoice.id,
+                invoice_pdf_url=invoice.invoice_pdf or '',
+                paid_at=datetime.fromtimestamp(paid_at, tz=dt_timezone.utc) if paid_at else None,
+            ))
+
+        # Duplicates hit the partial unique indexes and are dropped by ON CONFLICT DO NOTHING
+        PaymentHistory.objects.bulk_create(payments, batch_size=BATCH_SIZE, ignore_conflicts=True)
+        self.stdout.write(self.style.SUCCESS(f'Processed {len(payments)} paid invoices'))
@@ -0,0 +1,111 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:08
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubscriptionPlan',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, verbose_name='name')),
+                ('slug', models.SlugField(unique=True, verbose_name='slug')),
+                ('plan_type', models.CharField(choices=[('free', 'Free'), ('basic', 'Basic'), ('premium', 'Premium'), ('enterprise', 'Enterprise')], max_length=20, unique=True, verbose_name='plan type')),
+                ('stripe_price_id', models.CharField(blank=True, max_length=255, verbose_name='stripe price ID')),
+                ('price_monthly', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='monthly price')),
+                ('price_yearly', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='yearly price')),
+                ('currency', models.CharField(default='SAR', max_length=3, verbose_name='currency')),
+                ('max_properties', models.IntegerField(default=10, verbose_name='max properties')),
+                ('max_users', models.IntegerField(default=2, verbose_name='max users')),
+                ('max_auctions', models.IntegerField(default=5, verbose_name='max auctions per month')),
+                ('max_tenants', models.IntegerField(default=10, verbose_name='max tenants')),
+                ('has_analytics', models.BooleanField(default=False, verbose_name='has analytics')),
+                ('has_api_access', models.BooleanField(default=False, verbose_name='has API access')),
+                ('has_custom_branding', models.BooleanField(default=False, verbose_name='has custom branding')),
+                ('has_priority_support', models.BooleanField(default=False, verbose_name='has priority support')),
+                ('has_tenant_portal', models.BooleanField(default=False, verbose_name='has tenant portal')),
+                ('has_maintenance_module', models.BooleanField(default=False, verbose_name='has maintenance module')),
+                ('has_document_storage', models.BooleanField(default=False, verbose_name='has document storage')),
+                ('has_advanced_reporting', models.BooleanField(default=False, verbose_name='has advanced reporting')),
+                ('has_sms_notifications', models.BooleanField(default=False, verbose_name='has SMS notifications')),
+                ('storage_limit', models.IntegerField(default=5, verbose_name='storage limit (GB)')),
+                ('is_active', models.BooleanField(default=True, verbose_name='is active')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+            ],
+            options={
+                'verbose_name': 'Subscription Plan',
+                'verbose_name_plural': 'Subscription Plans',
+                'db_table': 'subscription_plans',
+                'ordering': ['price_monthly'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Subscription',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('stripe_subscription_id', models.CharField(blank=True, max_length=255, unique=True, verbose_name='stripe subscription ID')),
+                ('stripe_customer_id', models.CharField(blank=True, max_length=255, verbose_name='stripe customer ID')),
+                ('status', models.CharField(choices=[('active', 'Active'), ('canceled', 'Canceled'), ('past_due', 'Past Due'), ('trialing', 'Trialing'), ('paused', 'Paused')], default='trialing', max_length=20, verbose_name='status')),
+                ('billing_period', models.CharField(choices=[('monthly', 'Monthly'), ('yearly', 'Yearly')], default='monthly', max_length=20, verbose_name='billing period')),
+                ('start_date', models.DateTimeField(auto_now_add=True, verbose_name='start date')),
+                ('end_date', models.DateTimeField(blank=True, null=True, verbose_name='end date')),
+                ('trial_end', models.DateTimeField(blank=True, null=True, verbose_name='trial end')),
+                ('canceled_at', models.DateTimeField(blank=True, null=True, verbose_name='canceled at')),
+                ('properties_count', models.IntegerField(default=0, verbose_name='properties count')),
+                ('users_count', models.IntegerField(default=1, verbose_name='users count')),
+                ('auctions_this_month', models.IntegerField(default=0, verbose_name='auctions this month')),
+                ('storage_used', models.FloatField(default=0.0, verbose_name='storage used (GB)')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='subscription', to=settings.AUTH_USER_MODEL)),
+                ('plan', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='subscriptions', to='subscriptions.subscriptionplan')),
+            ],
+            options={
+                'verbose_name': 'Subscription',
+                'verbose_name_plural': 'Subscriptions',
+                'db_table': 'subscriptions',
+            },
+        ),
+        migrations.CreateModel(
+            name='PaymentHistory',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('stripe_payment_intent_id', models.CharField(max_length=255, unique=True, verbose_name='stripe payment intent ID')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='amount')),
+                ('currency', models.CharField(default='SAR', max_length=3, verbose_name='currency')),
+                ('status', models.CharField(choices=[('succeeded', 'Succeeded'), ('pending', 'Pending'), ('failed', 'Failed'), ('refunded', 'Refunded')], max_length=20, verbose_name='status')),
+                ('invoice_number', models.CharField(max_length=100, unique=True, verbose_name='invoice number')),
+                ('invoice_pdf_url', models.URLField(blank=True, verbose_name='invoice PDF URL')),
+                ('paid_at', models.DateTimeField(blank=True, null=True, verbose_name='paid at')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('subscription', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payments', to='subscriptions.subscription')),
+            ],
+            options={
+                'verbose_name': 'Payment History',
+                'verbose_name_plural': 'Payment Histories',
+                'db_table': 'payment_history',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['stripe_payment_intent_id'], name='payment_his_stripe__0d3c9d_idx'), models.Index(fields=['invoice_number'], name='payment_his_invoice_befd3c_idx')],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(fields=['stripe_subscription_id'], name='subscriptio_stripe__aa726e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(fields=['status', 'end_date'], name='subscriptio_status_fc7385_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+from django.db import migrations, models
+
+# Bit order matches SubscriptionPlan.FLAG_*
+FLAG_FIELDS = [
+    'has_analytics',
+    'has_api_access',
+    'has_custom_branding',
+    'has_priority_support',
+    'has_tenant_portal',
+    'has_maintenance_module',
+    'has_document_storage',
+    'has_advanced_reporting',
+    'has_sms_notifications',
+]
+
+
+def pack_flags(apps, schema_editor):
+    SubscriptionPlan = apps.get_model('subscriptions', 'SubscriptionPlan')
+    for plan in SubscriptionPlan.objects.all():
+        plan.feature_flags = sum(
+            1 << bit for bit, field in enumerate(FLAG_FIELDS) if getattr(plan, field)
+        )
+        plan.save(update_fields=['feature_flags'])
+
+
+def unpack_flags(apps, schema_editor):
+    SubscriptionPlan = apps.get_model('subscriptions', 'SubscriptionPlan')
+    for plan in SubscriptionPlan.objects.all():
+        for bit, field in enumerate(FLAG_FIELDS):
+            setattr(plan, field, bool(plan.feature_flags & (1 << bit)))
+        plan.save(update_fields=FLAG_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subscriptionplan',
+            name='feature_flags',
+            field=models.PositiveIntegerField(default=0, verbose_name='feature flags'),
+        ),
+        migrations.RunPython(pack_flags, unpack_flags),
+    ] + [
+        migrations.RemoveField(model_name='subscriptionplan', name=field)
+        for field in FLAG_FIELDS
+    ]
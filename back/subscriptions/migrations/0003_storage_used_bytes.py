@@ -0,0 +1,40 @@
+from django.db import migrations, models
+from django.db.models.functions import Cast, Round
+
+BYTES_PER_GB = 1 << 30
+
+
+def gb_to_bytes(apps, schema_editor):
+    Subscription = apps.get_model('subscriptions', 'Subscription')
+    Subscription.objects.update(
+        storage_used_bytes=Cast(
+            Round(models.F('storage_used') * BYTES_PER_GB), models.BigIntegerField()
+        )
+    )
+
+
+def bytes_to_gb(apps, schema_editor):
+    Subscription = apps.get_model('subscriptions', 'Subscription')
+    Subscription.objects.update(
+        storage_used=Cast(models.F('storage_used_bytes'), models.FloatField()) / BYTES_PER_GB
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0002_plan_feature_flags'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subscription',
+            name='storage_used_bytes',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='storage used (bytes)'),
+        ),
+        migrations.RunPython(gb_to_bytes, bytes_to_gb),
+        migrations.RemoveField(
+            model_name='subscription',
+            name='storage_used',
+        ),
+    ]
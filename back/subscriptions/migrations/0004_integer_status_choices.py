@@ -0,0 +1,109 @@
+from django.db import migrations, models
+
+SUBSCRIPTION_STATUS = {'active': 1, 'canceled': 2, 'past_due': 3, 'trialing': 4, 'paused': 5}
+BILLING_PERIOD = {'monthly': 1, 'yearly': 2}
+PAYMENT_STATUS = {'succeeded': 1, 'pending': 2, 'failed': 3, 'refunded': 4}
+
+# (model, old text column, temporary integer column, mapping)
+CONVERSIONS = [
+    ('Subscription', 'status', 'status_code', SUBSCRIPTION_STATUS),
+    ('Subscription', 'billing_period', 'billing_period_code', BILLING_PERIOD),
+    ('PaymentHistory', 'status', 'status_code', PAYMENT_STATUS),
+]
+
+
+def text_to_codes(apps, schema_editor):
+    # Any value outside the mappings stays NULL and fails the NOT NULL alter below
+    for model_name, old, new, mapping in CONVERSIONS:
+        model = apps.get_model('subscriptions', model_name)
+        for text, code in mapping.items():
+            model.objects.filter(**{old: text}).update(**{new: code})
+
+
+def codes_to_text(apps, schema_editor):
+    for model_name, old, new, mapping in CONVERSIONS:
+        model = apps.get_model('subscriptions', model_name)
+        for text, code in mapping.items():
+            model.objects.filter(**{new: code}).update(**{old: text})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0003_storage_used_bytes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='subscription',
+            name='subscriptio_status_fc7385_idx',
+        ),
+        migrations.AddField(
+            model_name='subscription',
+            name='status_code',
+            field=models.SmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='subscription',
+            name='billing_period_code',
+            field=models.SmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='paymenthistory',
+            name='status_code',
+            field=models.SmallIntegerField(null=True),
+        ),
+        # Nullable first so reversing the RemoveField below can re-add the column
+        migrations.AlterField(
+            model_name='paymenthistory',
+            name='status',
+            field=models.CharField(choices=[('succeeded', 'Succeeded'), ('pending', 'Pending'), ('failed', 'Failed'), ('refunded', 'Refunded')], max_length=20, null=True, verbose_name='status'),
+        ),
+        migrations.RunPython(text_to_codes, codes_to_text),
+        migrations.RemoveField(
+            model_name='subscription',
+            name='status',
+        ),
+        migrations.RemoveField(
+            model_name='subscription',
+            name='billing_period',
+        ),
+        migrations.RemoveField(
+            model_name='paymenthistory',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='subscription',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RenameField(
+            model_name='subscription',
+            old_name='billing_period_code',
+            new_name='billing_period',
+        ),
+        migrations.RenameField(
+            model_name='paymenthistory',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.AlterField(
+            model_name='subscription',
+            name='status',
+            field=models.SmallIntegerField(choices=[(1, 'Active'), (2, 'Canceled'), (3, 'Past Due'), (4, 'Trialing'), (5, 'Paused')], default=4, verbose_name='status'),
+        ),
+        migrations.AlterField(
+            model_name='subscription',
+            name='billing_period',
+            field=models.SmallIntegerField(choices=[(1, 'Monthly'), (2, 'Yearly')], default=1, verbose_name='billing period'),
+        ),
+        migrations.AlterField(
+            model_name='paymenthistory',
+            name='status',
+            field=models.SmallIntegerField(choices=[(1, 'Succeeded'), (2, 'Pending'), (3, 'Failed'), (4, 'Refunded')], verbose_name='status'),
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(fields=['status', 'end_date'], name='subscriptio_status_fc7385_idx'),
+        ),
+    ]
@@ -0,0 +1,69 @@
+from django.db import migrations, models
+
+# ISO 4217 alphabetic -> numeric
+CURRENCY_CODES = {'SAR': 682, 'USD': 840, 'EUR': 978}
+CURRENCY_MODELS = ['SubscriptionPlan', 'PaymentHistory']
+
+
+def alpha_to_numeric(apps, schema_editor):
+    # Any other currency stays NULL and fails the NOT NULL alter below
+    for model_name in CURRENCY_MODELS:
+        model = apps.get_model('subscriptions', model_name)
+        for alpha, numeric in CURRENCY_CODES.items():
+            model.objects.filter(currency__iexact=alpha).update(currency_code=numeric)
+
+
+def numeric_to_alpha(apps, schema_editor):
+    for model_name in CURRENCY_MODELS:
+        model = apps.get_model('subscriptions', model_name)
+        for alpha, numeric in CURRENCY_CODES.items():
+            model.objects.filter(currency_code=numeric).update(currency=alpha)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0004_integer_status_choices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subscriptionplan',
+            name='currency_code',
+            field=models.SmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='paymenthistory',
+            name='currency_code',
+            field=models.SmallIntegerField(null=True),
+        ),
+        migrations.RunPython(alpha_to_numeric, numeric_to_alpha),
+        migrations.RemoveField(
+            model_name='subscriptionplan',
+            name='currency',
+        ),
+        migrations.RemoveField(
+            model_name='paymenthistory',
+            name='currency',
+        ),
+        migrations.RenameField(
+            model_name='subscriptionplan',
+            old_name='currency_code',
+            new_name='currency',
+        ),
+        migrations.RenameField(
+            model_name='paymenthistory',
+            old_name='currency_code',
+            new_name='currency',
+        ),
+        migrations.AlterField(
+            model_name='subscriptionplan',
+            name='currency',
+            field=models.SmallIntegerField(choices=[(682, 'SAR'), (840, 'USD'), (978, 'EUR')], default=682, verbose_name='currency'),
+        ),
+        migrations.AlterField(
+            model_name='paymenthistory',
+            name='currency',
+            field=models.SmallIntegerField(choices=[(682, 'SAR'), (840, 'USD'), (978, 'EUR')], default=682, verbose_name='currency'),
+        ),
+    ]
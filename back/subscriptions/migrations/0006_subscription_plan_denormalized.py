@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+def copy_plan_fields(apps, schema_editor):
+    Subscription = apps.get_model('subscriptions', 'Subscription')
+    SubscriptionPlan = apps.get_model('subscriptions', 'SubscriptionPlan')
+    plan = SubscriptionPlan.objects.filter(pk=models.OuterRef('plan_id'))
+    Subscription.objects.update(
+        plan_type_cached=models.Subquery(plan.values('plan_type')[:1]),
+        feature_flags_cached=models.Subquery(plan.values('feature_flags')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0005_currency_numeric_codes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subscription',
+            name='plan_type_cached',
+            field=models.CharField(blank=True, editable=False, max_length=20, verbose_name='plan type'),
+        ),
+        migrations.AddField(
+            model_name='subscription',
+            name='feature_flags_cached',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='feature flags'),
+        ),
+        migrations.RunPython(copy_plan_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,113 @@
+import django.contrib.postgres.indexes
+import subscriptions.models
+from django.db import migrations, models
+
+
+def start_current_period(apps, schema_editor):
+    # Nothing reset auctions_this_month before, so existing counts are taken
+    # as this month's; the lazy reset zeroes them once the month rolls over
+    Subscription = apps.get_model('subscriptions', 'Subscription')
+    Subscription.objects.update(period_start=subscriptions.models.current_period_start())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0006_subscription_plan_denormalized'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subscription',
+            name='period_start',
+            field=models.DateField(db_index=True, default=subscriptions.models.current_period_start, verbose_name='period start'),
+        ),
+        migrations.RunPython(start_current_period, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='subscriptionplan',
+            name='id',
+            field=models.UUIDField(default=subscriptions.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='subscription',
+            name='id',
+            field=models.UUIDField(default=subscriptions.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='paymenthistory',
+            name='id',
+            field=models.UUIDField(default=subscriptions.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(condition=models.Q(('status', 4)), fields=['trial_end'], name='sub_trialing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(condition=models.Q(('status', 1)), fields=['end_date'], name='sub_active_end_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(condition=models.Q(('canceled_at__isnull', False)), fields=['canceled_at'], name='sub_canceled_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(fields=['user'], include=('plan', 'status'), name='sub_user_cover_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paymenthistory',
+            index=models.Index(fields=['subscription', '-created_at'], name='payment_his_subscri_982871_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='subscription',
+            name='subscriptio_stripe__aa726e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='paymenthistory',
+            name='payment_his_stripe__0d3c9d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='paymenthistory',
+            name='payment_his_invoice_befd3c_idx',
+        ),
+        migrations.AlterField(
+            model_name='subscription',
+            name='stripe_subscription_id',
+            field=models.CharField(blank=True, max_length=255, verbose_name='stripe subscription ID'),
+        ),
+        migrations.AlterField(
+            model_name='paymenthistory',
+            name='stripe_payment_intent_id',
+            field=models.CharField(max_length=255, verbose_name='stripe payment intent ID'),
+        ),
+        migrations.AlterField(
+            model_name='paymenthistory',
+            name='invoice_number',
+            field=models.CharField(max_length=100, verbose_name='invoice number'),
+        ),
+        migrations.AddConstraint(
+            model_name='subscription',
+            constraint=models.UniqueConstraint(condition=models.Q(('stripe_subscription_id', ''), _negated=True), fields=('stripe_subscription_id',), name='uniq_stripe_sub_nonempty'),
+        ),
+        migrations.AddConstraint(
+            model_name='subscription',
+            constraint=models.UniqueConstraint(condition=models.Q(('stripe_customer_id', ''), _negated=True), fields=('stripe_customer_id',), name='uniq_stripe_customer_nonempty'),
+        ),
+        migrations.AddConstraint(
+            model_name='paymenthistory',
+            constraint=models.UniqueConstraint(condition=models.Q(('stripe_payment_intent_id', ''), _negated=True), fields=('stripe_payment_intent_id',), name='uniq_payment_intent_nonempty'),
+        ),
+        migrations.AddConstraint(
+            model_name='paymenthistory',
+            constraint=models.UniqueConstraint(condition=models.Q(('invoice_number', ''), _negated=True), fields=('invoice_number',), name='uniq_invoice_number_nonempty'),
+        ),
+        migrations.AlterField(
+            model_name='paymenthistory',
+            name='invoice_pdf_url',
+            field=models.CharField(blank=True, max_length=500, verbose_name='invoice PDF URL'),
+        ),
+        migrations.AddIndex(
+            model_name='paymenthistory',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['paid_at'], name='payment_paid_at_brin', pages_per_range=32),
+        ),
+    ]
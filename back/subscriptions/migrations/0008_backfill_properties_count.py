@@ -0,0 +1,23 @@
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def count_owned_properties(apps, schema_editor):
+    Subscription = apps.get_model('subscriptions', 'Subscription')
+    Property = apps.get_model('properties', 'Property')
+    owned = Property.objects.filter(owner=models.OuterRef('user_id')).order_by().values('owner').annotate(
+        total=models.Count('pk')
+    ).values('total')
+    Subscription.objects.update(properties_count=Coalesce(models.Subquery(owned[:1]), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0007_subscription_schema'),
+        ('properties', '0002_price_per_sqm_generated'),
+    ]
+
+    operations = [
+        migrations.RunPython(count_owned_properties, migrations.RunPython.noop),
+    ]
@@ -1,20 +1,97 @@
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
+from django.db.models.functions import Greatest, TruncMonth
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
+from django.utils import timezone
+import os
+import time
 import uuid
 
+PLAN_CACHE_TTL = 60
+
+BYTES_PER_GB = 1 << 30
+
+# plan_id -> (expires_at, SubscriptionPlan); cleared per plan by the subscriptions signals
+_PLAN_CACHE = {}
+
+
+def uuid7():
+    """Time-ordered UUID (RFC 9562 v7) so new primary keys append to the right edge of the index."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+class Currency(models.IntegerChoices):
+    """ISO 4217 numeric currency codes."""
+    SAR = 682, 'SAR'
+    USD = 840, 'USD'
+    EUR = 978, 'EUR'
+
+
+class SubscriptionStatus(models.IntegerChoices):
+    ACTIVE = 1, 'Active'
+    CANCELED = 2, 'Canceled'
+    PAST_DUE = 3, 'Past Due'
+    TRIALING = 4, 'Trialing'
+    PAUSED = 5, 'Paused'
+
+
+class BillingPeriod(models.IntegerChoices):
+    MONTHLY = 1, 'Monthly'
+    YEARLY = 2, 'Yearly'
+
+
+class PaymentStatus(models.IntegerChoices):
+    SUCCEEDED = 1, 'Succeeded'
+    PENDING = 2, 'Pending'
+    FAILED = 3, 'Failed'
+    REFUNDED = 4, 'Refunded'
+
+
+def current_period_start():
+    """First day of the current month; the window auctions_this_month counts."""
+    return timezone.localdate().replace(day=1)
+
+
+def _feature_flag(flag):
+    """Boolean attribute backed by one bit of feature_flags."""
+    def getter(self):
+        return bool(self.feature_flags & flag)
+    
+    def setter(self, value):
+        if value:
+            self.feature_flags |= flag
+        else:
+            self.feature_flags &= ~flag
+    
+    return property(getter, setter)
+
 
 class SubscriptionPlan(models.Model):
     """Subscription plans for the SaaS platform."""
     
+    FLAG_ANALYTICS = 1 << 0
+    FLAG_API_ACCESS = 1 << 1
+    FLAG_CUSTOM_BRANDING = 1 << 2
+    FLAG_PRIORITY_SUPPORT = 1 << 3
+    FLAG_TENANT_PORTAL = 1 << 4
+    FLAG_MAINTENANCE_MODULE = 1 << 5
+    FLAG_DOCUMENT_STORAGE = 1 << 6
+    FLAG_ADVANCED_REPORTING = 1 << 7
+    FLAG_SMS_NOTIFICATIONS = 1 << 8
+    
     PLAN_TYPES = (
         ('free', 'Free'),
         ('basic', 'Basic'),
         ('premium', 'Premium'),
         ('enterprise', 'Enterprise'),
     )
+    PLAN_TYPE_DISPLAY = dict(PLAN_TYPES)
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(_('name'), max_length=100)
     slug = models.SlugField(_('slug'), unique=True)
     plan_type = models.CharField(_('plan type'), max_length=20, choices=PLAN_TYPES, unique=True)
@@ -23,7 +100,7 @@ class SubscriptionPlan(models.Model):
     # Pricing
     price_monthly = models.DecimalField(_('monthly price'), max_digits=10, decimal_places=2)
     price_yearly = models.DecimalField(_('yearly price'), max_digits=10, decimal_places=2)
-    currency = models.CharField(_('currency'), max_length=3, default='SAR')
+    currency = models.SmallIntegerField(_('currency'), choices=Currency.choices, default=Currency.SAR)
     
     # Features
     max_properties = models.IntegerField(_('max properties'), default=10)
@@ -31,16 +108,8 @@ class SubscriptionPlan(models.Model):
     max_auctions = models.IntegerField(_('max auctions per month'), default=5)
     max_tenants = models.IntegerField(_('max tenants'), default=10)
     
-    # Feature flags
-    has_analytics = models.BooleanField(_('has analytics'), default=False)
-    has_api_access = models.BooleanField(_('has API access'), default=False)
-    has_custom_branding = models.BooleanField(_('has custom branding'), default=False)
-    has_priority_support = models.BooleanField(_('has priority support'), default=False)
-    has_tenant_portal = models.BooleanField(_('has tenant portal'), default=False)
-    has_maintenance_module = models.BooleanField(_('has maintenance module'), default=False)
-    has_document_storage = models.BooleanField(_('has document storage'), default=False)
-    has_advanced_reporting = models.BooleanField(_('has advanced reporting'), default=False)
-    has_sms_notifications = models.BooleanField(_('has SMS notifications'), default=False)
+    # Feature flags, packed into one integer (see FLAG_* and has())
+    feature_flags = models.PositiveIntegerField(_('feature flags'), default=0)
     
     # Storage limits (in GB)
     storage_limit = models.IntegerField(_('storage limit (GB)'), default=5)
@@ -56,37 +125,99 @@ class SubscriptionPlan(models.Model):
         verbose_name_plural = _('Subscription Plans')
         ordering = ['price_monthly']
     
+    has_analytics = _feature_flag(FLAG_ANALYTICS)
+    has_api_access = _feature_flag(FLAG_API_ACCESS)
+    has_custom_branding = _feature_flag(FLAG_CUSTOM_BRANDING)
+    has_priority_support = _feature_flag(FLAG_PRIORITY_SUPPORT)
+    has_tenant_portal = _feature_flag(FLAG_TENANT_PORTAL)
+    has_maintenance_module = _feature_flag(FLAG_MAINTENANCE_MODULE)
+    has_document_storage = _feature_flag(FLAG_DOCUMENT_STORAGE)
+    has_advanced_reporting = _feature_flag(FLAG_ADVANCED_REPORTING)
+    has_sms_notifications = _feature_flag(FLAG_SMS_NOTIFICATIONS)
+    
+    @classmethod
+    def get_cached(cls, plan_id):
+        """
+        Return the plan's limits and flags from a per-process cache.
+        Saves clear the entry in the saving process; other workers pick
+        the change up within PLAN_CACHE_TTL seconds.
+        """
+        now = time.monotonic()
+        entry = _PLAN_CACHE.get(plan_id)
+        if entry is None or entry[0] < now:
+            plan = cls.objects.only(
+                'plan_type', 'max_properties', 'max_users', 'max_auctions',
+                'max_tenants', 'feature_flags', 'storage_limit'
+            ).get(pk=plan_id)
+            entry = _PLAN_CACHE[plan_id] = (now + PLAN_CACHE_TTL, plan)
+        return entry[1]
+    
+    @property
+    def currency_code(self):
+        return Currency(self.currency).label
+    
+    @property
+    def storage_limit_bytes(self):
+        return self.storage_limit * BYTES_PER_GB
+    
+    def has(self, flags):
+        """Check that every bit in flags is enabled, e.g. has(FLAG_ANALYTICS | FLAG_API_ACCESS)."""
+        return self.feature_flags & flags == flags
+    
+    def enable(self, flags):
+        self.feature_flags |= flags
+    
+    def disable(self, flags):
+        self.feature_flags &= ~flags
+    
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Keep the copies on Subscription in step with the plan
+        Subscription.objects.filter(plan=self).update(
+            plan_type_cached=self.plan_type, feature_flags_cached=self.feature_flags
+        )
+    
     def __str__(self):
-        return f"{self.name} ({self.get_plan_type_display()})"
+        return f"{self.name} ({self.PLAN_TYPE_DISPLAY.get(self.plan_type, self.plan_type)})"
+
+
+class SubscriptionManager(models.Manager):
+    """Always join user and plan; __str__, quota checks and serializers read both."""
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('user', 'plan')
+    
+    def active(self):
+        """Subscriptions for which is_active() holds, filtered in SQL."""
+        # status = ACTIVE matches the sub_active_end_idx predicate, so this is an index scan
+        return self.filter(status=SubscriptionStatus.ACTIVE).filter(
+            models.Q(end_date__isnull=True) | models.Q(end_date__gt=timezone.now())
+        )
+    
+    def adjust_usage(self, user_id, **deltas):
+        """Apply counter deltas in one atomic UPDATE, e.g. adjust_usage(uid, properties_count=1). Counters stop at 0."""
+        return self.filter(user_id=user_id).update(
+            **{field: Greatest(models.F(field) + delta, 0) for field, delta in deltas.items()}
+        )
 
 
 class Subscription(models.Model):
     """User subscriptions."""
     
-    STATUS_CHOICES = (
-        ('active', 'Active'),
-        ('canceled', 'Canceled'),
-        ('past_due', 'Past Due'),
-        ('trialing', 'Trialing'),
-        ('paused', 'Paused'),
-    )
-    
-    BILLING_PERIOD = (
-        ('monthly', 'Monthly'),
-        ('yearly', 'Yearly'),
-    )
+    Status = SubscriptionStatus
+    BillingPeriod = BillingPeriod
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='subscription')
     plan = models.ForeignKey(SubscriptionPlan, on_delete=models.PROTECT, related_name='subscriptions')
     
     # Stripe fields
-    stripe_subscription_id = models.CharField(_('stripe subscription ID'), max_length=255, unique=True, blank=True)
+    stripe_subscription_id = models.CharField(_('stripe subscription ID'), max_length=255, blank=True)
     stripe_customer_id = models.CharField(_('stripe customer ID'), max_length=255, blank=True)
     
     # Subscription details
-    status = models.CharField(_('status'), max_length=20, choices=STATUS_CHOICES, default='trialing')
-    billing_period = models.CharField(_('billing period'), max_length=20, choices=BILLING_PERIOD, default='monthly')
+    status = models.SmallIntegerField(_('status'), choices=SubscriptionStatus.choices, default=SubscriptionStatus.TRIALING)
+    billing_period = models.SmallIntegerField(_('billing period'), choices=BillingPeriod.choices, default=BillingPeriod.MONTHLY)
     
     # Dates
     start_date = models.DateTimeField(_('start date'), auto_now_add=True)
@@ -98,60 +229,112 @@ class Subscription(models.Model):
     properties_count = models.IntegerField(_('properties count'), default=0)
     users_count = models.IntegerField(_('users count'), default=1)
     auctions_this_month = models.IntegerField(_('auctions this month'), default=0)
-    storage_used = models.FloatField(_('storage used (GB)'), default=0.0)
+    period_start = models.DateField(_('period start'), default=current_period_start, db_index=True)
+    storage_used_bytes = models.PositiveBigIntegerField(_('storage used (bytes)'), default=0)
+    
+    # Copied from plan so feature gates read this row alone (synced by both save() methods)
+    plan_type_cached = models.CharField(_('plan type'), max_length=20, blank=True, editable=False)
+    feature_flags_cached = models.PositiveIntegerField(_('feature flags'), default=0, editable=False)
     
     # Meta
     created_at = models.DateTimeField(_('created at'), auto_now_add=True)
     updated_at = models.DateTimeField(_('updated at'), auto_now=True)
     
+    objects = SubscriptionManager()
+    
     class Meta:
         db_table = 'subscriptions'
         verbose_name = _('Subscription')
         verbose_name_plural = _('Subscriptions')
         indexes = [
-            models.Index(fields=['stripe_subscription_id']),
             models.Index(fields=['status', 'end_date']),
+            # Trial-expiry and renewal sweeps only touch one status each
+            models.Index(fields=['trial_end'], condition=models.Q(status=SubscriptionStatus.TRIALING), name='sub_trialing_idx'),
+            models.Index(fields=['end_date'], condition=models.Q(status=SubscriptionStatus.ACTIVE), name='sub_active_end_idx'),
+            models.Index(fields=['canceled_at'], condition=models.Q(canceled_at__isnull=False), name='sub_canceled_idx'),
+            # Covers the per-user status/plan lookups as index-only scans
+            models.Index(fields=['user'], include=['plan', 'status'], name='sub_user_cover_idx'),
+        ]
+        constraints = [
+            # Rows created before Stripe responds carry '' and stay out of the unique indexes
+            models.UniqueConstraint(
+                fields=['stripe_subscription_id'],
+                condition=~models.Q(stripe_subscription_id=''),
+                name='uniq_stripe_sub_nonempty'
+            ),
+            models.UniqueConstraint(
+                fields=['stripe_customer_id'],
+                condition=~models.Q(stripe_customer_id=''),
+                name='uniq_stripe_customer_nonempty'
+            ),
         ]
     
     def is_active(self):
         """Check if subscription is active."""
         from django.utils import timezone
-        return self.status == 'active' and (self.end_date is None or self.end_date > timezone.now())
+        return self.status == SubscriptionStatus.ACTIVE and (self.end_date is None or self.end_date > timezone.now())
     
     def can_add_property(self):
         """Check if user can add more properties."""
-        return self.properties_count < self.plan.max_properties
+        return self.properties_count < SubscriptionPlan.get_cached(self.plan_id).max_properties
+    
+    def reset_period_if_stale(self):
+        """Zero auctions_this_month in the row once the month has rolled over."""
+        first_of_month = current_period_start()
+        if self.period_start < first_of_month:
+            Subscription.objects.filter(pk=self.pk, period_start__lt=first_of_month).update(
+                auctions_this_month=0, period_start=first_of_month
+            )
+            self.auctions_this_month = 0
+            self.period_start = first_of_month
     
     def can_add_auction(self):
         """Check if user can add more auctions this month."""
-        return self.auctions_this_month < self.plan.max_auctions
+        self.reset_period_if_stale()
+        return self.auctions_this_month < SubscriptionPlan.get_cached(self.plan_id).max_auctions
+    
+    def has_feature(self, flags):
+        """Plan feature check without touching the plan row, e.g. has_feature(SubscriptionPlan.FLAG_API_ACCESS)."""
+        return self.feature_flags_cached & flags == flags
+    
+    def save(self, *args, **kwargs):
+        self.plan_type_cached = self.plan.plan_type
+        self.feature_flags_cached = self.plan.feature_flags
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'plan' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'plan_type_cached', 'feature_flags_cached'}
+        super().save(*args, **kwargs)
+    
+    def can_store(self, size_bytes=0):
+        """Check if another size_bytes fits in the plan's storage limit."""
+        return self.storage_used_bytes + size_bytes <= SubscriptionPlan.get_cached(self.plan_id).storage_limit_bytes
+    
+    @property
+    def storage_used(self):
+        """Storage used in GB, for display."""
+        return round(self.storage_used_bytes / BYTES_PER_GB, 3)
     
     def __str__(self):
-        return f"{self.user.email} - {self.plan.name} ({self.status})"
+        return f"{self.user.email} - {self.plan.name} ({self.get_status_display()})"
 
 
 class PaymentHistory(models.Model):
     """Payment history for subscriptions."""
     
-    STATUS_CHOICES = (
-        ('succeeded', 'Succeeded'),
-        ('pending', 'Pending'),
-        ('failed', 'Failed'),
-        ('refunded', 'Refunded'),
-    )
+    Status = PaymentStatus
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     subscription = models.ForeignKey(Subscription, on_delete=models.CASCADE, related_name='payments')
     
     # Payment details
-    stripe_payment_intent_id = models.CharField(_('stripe payment intent ID'), max_length=255, unique=True)
+    stripe_payment_intent_id = models.CharField(_('stripe payment intent ID'), max_length=255)
     amount = models.DecimalField(_('amount'), max_digits=10, decimal_places=2)
-    currency = models.CharField(_('currency'), max_length=3, default='SAR')
-    status = models.CharField(_('status'), max_length=20, choices=STATUS_CHOICES)
+    currency = models.SmallIntegerField(_('currency'), choices=Currency.choices, default=Currency.SAR)
+    status = models.SmallIntegerField(_('status'), choices=PaymentStatus.choices)
     
     # Invoice
-    invoice_number = models.CharField(_('invoice number'), max_length=100, unique=True)
-    invoice_pdf_url = models.URLField(_('invoice PDF URL'), blank=True)
+    invoice_number = models.CharField(_('invoice number'), max_length=100)
+    invoice_pdf_url = models.CharField(_('invoice PDF URL'), max_length=500, blank=True)
     
     # Meta
     paid_at = models.DateTimeField(_('paid at'), null=True, blank=True)
@@ -163,9 +346,42 @@ class PaymentHistory(models.Model):
         verbose_name_plural = _('Payment Histories')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['stripe_payment_intent_id']),
-            models.Index(fields=['invoice_number']),
+            models.Index(fields=['subscription', '-created_at']),
+            # Rows are appended roughly in paid_at order, so a BRIN summary serves report date ranges
+            BrinIndex(fields=['paid_at'], pages_per_range=32, name='payment_paid_at_brin'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['stripe_payment_intent_id'],
+                condition=~models.Q(stripe_payment_intent_id=''),
+                name='uniq_payment_intent_nonempty'
+            ),
+            models.UniqueConstraint(
+                fields=['invoice_number'],
+                condition=~models.Q(invoice_number=''),
+                name='uniq_invoice_number_nonempty'
+            ),
         ]
     
     def __str__(self):
-        return f"{self.invoice_number} - {self.amount} {self.currency}"
\ No newline at end of file
+        return f"{self.invoice_number} - {self.amount} {self.currency_code}"
+    
+    @classmethod
+    def monthly_totals(cls, since):
+        """Succeeded revenue per month and currency, aggregated in one query."""
+        return cls.objects.filter(
+            status=PaymentStatus.SUCCEEDED, paid_at__gte=since
+        ).annotate(month=TruncMonth('paid_at')).values('month', 'currency').annotate(
+            total=models.Sum('amount'), payments=models.Count('id')
+        ).order_by('month', 'currency')
+    
+    @classmethod
+    def export_rows(cls, since, chunk_size=2000):
+        """Stream (invoice_number, amount, currency, status, paid_at) tuples without building model instances."""
+        return cls.objects.filter(paid_at__gte=since).order_by('paid_at').values_list(
+            'invoice_number', 'amount', 'currency', 'status', 'paid_at'
+        ).iterator(chunk_size=chunk_size)
+    
+    @property
+    def currency_code(self):
+        return Currency(self.currency).label
\ No newline at end of file
@@ -1,13 +1,44 @@
 from rest_framework import serializers
-from .models import SubscriptionPlan, Subscription, PaymentHistory
+from .models import SubscriptionPlan, Subscription, PaymentHistory, SubscriptionStatus, BillingPeriod, PaymentStatus
+
+
+class ChoiceSlugField(serializers.Field):
+    """Expose an IntegerChoices column as its lowercase member name, e.g. 'past_due'."""
+    
+    default_error_messages = {
+        'invalid_choice': '"{input}" is not a valid choice.'
+    }
+    
+    def __init__(self, choices_class, **kwargs):
+        self.choices_class = choices_class
+        super().__init__(**kwargs)
+    
+    def to_representation(self, value):
+        return self.choices_class(value).name.lower()
+    
+    def to_internal_value(self, data):
+        try:
+            return self.choices_class[str(data).upper()]
+        except KeyError:
+            self.fail('invalid_choice', input=data)
 
 
 class SubscriptionPlanSerializer(serializers.ModelSerializer):
+    currency = serializers.CharField(source='currency_code', read_only=True)
     features = serializers.SerializerMethodField()
     
     class Meta:
         model = SubscriptionPlan
-        fields = '__all__'
+        # has_* are read from the feature_flags bitmask by model properties
+        fields = [
+            'id', 'name', 'slug', 'plan_type', 'stripe_price_id',
+            'price_monthly', 'price_yearly', 'currency',
+            'max_properties', 'max_users', 'max_auctions', 'max_tenants',
+            'has_analytics', 'has_api_access', 'has_custom_branding',
+            'has_priority_support', 'has_tenant_portal', 'has_maintenance_module',
+            'has_document_storage', 'has_advanced_reporting', 'has_sms_notifications',
+            'storage_limit', 'is_active', 'created_at', 'updated_at', 'features'
+        ]
     
     def get_features(self, obj):
         return {
@@ -29,6 +60,8 @@ class SubscriptionPlanSerializer(serializers.ModelSerializer):
 
 
 class SubscriptionSerializer(serializers.ModelSerializer):
+    status = ChoiceSlugField(SubscriptionStatus, required=False)
+    billing_period = ChoiceSlugField(BillingPeriod, required=False)
     plan_details = SubscriptionPlanSerializer(source='plan', read_only=True)
     is_active = serializers.SerializerMethodField()
     can_add_property = serializers.SerializerMethodField()
@@ -40,7 +73,7 @@ class SubscriptionSerializer(serializers.ModelSerializer):
             'id', 'user', 'plan', 'plan_details', 'stripe_subscription_id',
             'status', 'billing_period', 'start_date', 'end_date',
             'trial_end', 'canceled_at', 'properties_count', 'users_count',
-            'auctions_this_month', 'storage_used', 'is_active',
+            'auctions_this_month', 'storage_used', 'storage_used_bytes', 'is_active',
             'can_add_property', 'can_add_auction', 'created_at', 'updated_at'
         ]
         read_only_fields = [
@@ -58,6 +91,10 @@ class SubscriptionSerializer(serializers.ModelSerializer):
 
 
 class PaymentHistorySerializer(serializers.ModelSerializer):
+    status = ChoiceSlugField(PaymentStatus)
+    currency = serializers.CharField(source='currency_code', read_only=True)
+    invoice_pdf_url = serializers.URLField(max_length=500, required=False, allow_blank=True)
+    
     class Meta:
         model = PaymentHistory
         fields = '__all__'
@@ -66,5 +103,5 @@ class PaymentHistorySerializer(serializers.ModelSerializer):
 
 class CreateSubscriptionSerializer(serializers.Serializer):
     plan_id = serializers.UUIDField()
-    billing_period = serializers.ChoiceField(choices=['monthly', 'yearly'])
+    billing_period = ChoiceSlugField(BillingPeriod)
     payment_method_id = serializers.CharField()
\ No newline at end of file
@@ -0,0 +1,38 @@
+from django.db.models import Case, F, Value, When
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import _PLAN_CACHE, Subscription, SubscriptionPlan, current_period_start
+
+
+@receiver([post_save, post_delete], sender=SubscriptionPlan)
+def invalidate_plan_cache(sender, instance, **kwargs):
+    from .views import invalidate_plan_catalog
+    _PLAN_CACHE.pop(instance.pk, None)
+    invalidate_plan_catalog()
+
+
+@receiver(post_save, sender='properties.Property')
+def count_added_property(sender, instance, created, **kwargs):
+    if created:
+        Subscription.objects.adjust_usage(instance.owner_id, properties_count=1)
+
+
+@receiver(post_delete, sender='properties.Property')
+def count_removed_property(sender, instance, **kwargs):
+    Subscription.objects.adjust_usage(instance.owner_id, properties_count=-1)
+
+
+@receiver(post_save, sender='auctions.Auction')
+def count_added_auction(sender, instance, created, **kwargs):
+    if created:
+        # Roll the period over and count this auction in the same UPDATE, so a
+        # later lazy reset cannot wipe the increment
+        first_of_month = current_period_start()
+        Subscription.objects.filter(user_id=instance.seller_id).update(
+            auctions_this_month=Case(
+                When(period_start__lt=first_of_month, then=Value(1)),
+                default=F('auctions_this_month') + 1
+            ),
+            period_start=first_of_month
+        )
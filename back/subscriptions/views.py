@@ -1,14 +1,17 @@
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from django.core.cache import cache
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from django.db import transaction
 from django.utils import timezone
 from datetime import datetime, timedelta
 import stripe
 from django.conf import settings
-from .models import SubscriptionPlan, Subscription, PaymentHistory
+from .models import SubscriptionPlan, Subscription, PaymentHistory, SubscriptionStatus, BillingPeriod
 from .serializers import (
     SubscriptionPlanSerializer, SubscriptionSerializer,
     PaymentHistorySerializer, CreateSubscriptionSerializer
@@ -16,14 +19,26 @@ from .serializers import (
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
 
+PLAN_CATALOG_CACHE_KEY = 'subscription_plan_catalog'
+PLAN_CATALOG_CACHE_TIMEOUT = 3600
+
+
+def invalidate_plan_catalog():
+    cache.delete(PLAN_CATALOG_CACHE_KEY)
+
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def plan_list(request):
     """List all active subscription plans."""
-    plans = SubscriptionPlan.objects.filter(is_active=True).order_by('price_monthly')
-    serializer = SubscriptionPlanSerializer(plans, many=True)
-    return Response(serializer.data)
+    # The catalog is cached as rendered JSON, so a hit skips the ORM and the serializer
+    catalog = cache.get(PLAN_CATALOG_CACHE_KEY)
+    if catalog is None:
+        plans = SubscriptionPlan.objects.filter(is_active=True).order_by('price_monthly')
+        serializer = SubscriptionPlanSerializer(plans, many=True)
+        catalog = JSONRenderer().render(serializer.data)
+        cache.set(PLAN_CATALOG_CACHE_KEY, catalog, PLAN_CATALOG_CACHE_TIMEOUT)
+    return HttpResponse(catalog, content_type='application/json')
 
 
 @api_view(['GET'])
@@ -65,7 +80,7 @@ def create_subscription(request):
     )
     
     # Check if user already has a subscription
-    if Subscription.objects.filter(user=request.user, status='active').exists():
+    if Subscription.objects.filter(user=request.user, status=SubscriptionStatus.ACTIVE).exists():
         return Response(
             {'error': 'You already have an active subscription'},
             status=status.HTTP_400_BAD_REQUEST
@@ -117,10 +132,10 @@ def create_subscription(request):
                 plan=plan,
                 stripe_subscription_id=stripe_subscription.id,
                 stripe_customer_id=customer.id,
-                status='trialing',
+                status=SubscriptionStatus.TRIALING,
                 billing_period=billing_period,
                 trial_end=timezone.now() + timedelta(days=14),
-                end_date=timezone.now() + timedelta(days=30 if billing_period == 'monthly' else 365)
+                end_date=timezone.now() + timedelta(days=30 if billing_period == BillingPeriod.MONTHLY else 365)
             )
             
             # Update user subscription status
@@ -145,7 +160,7 @@ def create_subscription(request):
 def cancel_subscription(request):
     """Cancel subscription."""
     try:
-        subscription = Subscription.objects.get(user=request.user, status='active')
+        subscription = Subscription.objects.get(user=request.user, status=SubscriptionStatus.ACTIVE)
     except Subscription.DoesNotExist:
         return Response(
             {'error': 'No active subscription found'},
@@ -159,7 +174,7 @@ def cancel_subscription(request):
         )
         
         # Update local subscription
-        subscription.status = 'canceled'
+        subscription.status = SubscriptionStatus.CANCELED
         subscription.canceled_at = timezone.now()
         subscription.save()
         
@@ -191,7 +206,7 @@ def upgrade_subscription(request):
     new_plan = get_object_or_404(SubscriptionPlan, id=new_plan_id, is_active=True)
     
     try:
-        subscription = Subscription.objects.get(user=request.user, status='active')
+        subscription = Subscription.objects.get(user=request.user, status=SubscriptionStatus.ACTIVE)
     except Subscription.DoesNotExist:
         return Response(
             {'error': 'No active subscription found'},
@@ -282,9 +297,10 @@ def usage_stats(request):
                 },
                 'storage': {
                     'used_gb': subscription.storage_used,
+                    'used_bytes': subscription.storage_used_bytes,
                     'limit_gb': subscription.plan.storage_limit,
                     'percentage': round(
-                        (subscription.storage_used / subscription.plan.storage_limit * 100)
+                        (subscription.storage_used_bytes / subscription.plan.storage_limit_bytes * 100)
                         if subscription.plan.storage_limit > 0 else 0, 2
                     )
                 }
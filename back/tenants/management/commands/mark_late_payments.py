@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db.models import DateField, ExpressionWrapper, F, OuterRef, Subquery
+from django.utils import timezone
+
+from tenants.models import Lease, RentPayment
+
+
+class Command(BaseCommand):
+    help = 'Mark overdue rent payments as late and apply lease late fees; schedule daily.'
+
+    def handle(self, *args, **options):
+        today = timezone.now().date()
+
+        marked = RentPayment.objects.filter(
+            status='pending',
+            due_date__lt=today
+        ).update(status='late')
+
+        # Late fee once the lease's grace period has passed (date + integer days in SQL)
+        fees_applied = RentPayment.objects.alias(
+            grace_period_end=ExpressionWrapper(
+                F('due_date') + F('lease__grace_period_days'),
+                output_field=DateField()
+            )
+        ).filter(
+            status='late',
+            late_fee_applied=0,
+            lease__late_fee__gt=0,
+            grace_period_end__lt=today
+        ).update(
+            late_fee_applied=Subquery(
+                Lease.objects.filter(pk=OuterRef('lease_id')).values('late_fee')[:1]
+            )
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Marked {marked} payments late, applied late fees to {fees_applied}'
+        ))
@@ -0,0 +1,272 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:21
+
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('properties', '0001_initial'),
+        ('tenants', '0001_pg_trgm'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Lease',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('lease_number', models.CharField(max_length=50, unique=True, verbose_name='lease number')),
+                ('start_date', models.DateField(verbose_name='start date')),
+                ('end_date', models.DateField(verbose_name='end date')),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('active', 'Active'), ('expired', 'Expired'), ('terminated', 'Terminated'), ('renewed', 'Renewed')], default='draft', max_length=20, verbose_name='status')),
+                ('monthly_rent', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='monthly rent')),
+                ('security_deposit', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='security deposit')),
+                ('payment_frequency', models.CharField(choices=[('monthly', 'Monthly'), ('quarterly', 'Quarterly'), ('semi_annual', 'Semi-Annual'), ('annual', 'Annual')], default='monthly', max_length=20, verbose_name='payment frequency')),
+                ('late_fee', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=8, verbose_name='late fee')),
+                ('grace_period_days', models.IntegerField(default=5, verbose_name='grace period days')),
+                ('terms_conditions', models.TextField(blank=True, verbose_name='terms and conditions')),
+                ('special_conditions', models.TextField(blank=True, verbose_name='special conditions')),
+                ('auto_renew', models.BooleanField(default=False, verbose_name='auto renew')),
+                ('contract_document', models.FileField(blank=True, null=True, upload_to='leases/', verbose_name='contract document')),
+                ('signed_date', models.DateTimeField(blank=True, null=True, verbose_name='signed date')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('landlord', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leases_as_landlord', to=settings.AUTH_USER_MODEL)),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leases', to='properties.property')),
+            ],
+            options={
+                'verbose_name': 'Lease',
+                'verbose_name_plural': 'Leases',
+                'db_table': 'leases',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Tenant',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('first_name', models.CharField(max_length=150, verbose_name='first name')),
+                ('last_name', models.CharField(max_length=150, verbose_name='last name')),
+                ('email', models.EmailField(max_length=254, verbose_name='email')),
+                ('phone', models.CharField(max_length=20, verbose_name='phone')),
+                ('national_id', models.CharField(max_length=20, unique=True, verbose_name='national ID')),
+                ('occupation', models.CharField(blank=True, max_length=100, verbose_name='occupation')),
+                ('employer', models.CharField(blank=True, max_length=200, verbose_name='employer')),
+                ('monthly_income', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='monthly income')),
+                ('emergency_contact', models.JSONField(blank=True, default=dict, verbose_name='emergency contact')),
+                ('status', models.CharField(choices=[('active', 'Active'), ('inactive', 'Inactive'), ('pending', 'Pending'), ('blacklisted', 'Blacklisted')], default='pending', max_length=20, verbose_name='status')),
+                ('credit_score', models.IntegerField(blank=True, null=True, verbose_name='credit score')),
+                ('documents', models.JSONField(blank=True, default=list, verbose_name='documents')),
+                ('notes', models.TextField(blank=True, verbose_name='notes')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('landlord', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tenants', to=settings.AUTH_USER_MODEL)),
+                ('user', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='tenant_profile', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Tenant',
+                'verbose_name_plural': 'Tenants',
+                'db_table': 'tenants',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='RentPayment',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('amount_due', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='amount due')),
+                ('amount_paid', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10, verbose_name='amount paid')),
+                ('payment_date', models.DateField(blank=True, null=True, verbose_name='payment date')),
+                ('due_date', models.DateField(verbose_name='due date')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('paid', 'Paid'), ('partial', 'Partial'), ('late', 'Late'), ('failed', 'Failed')], default='pending', max_length=20, verbose_name='status')),
+                ('payment_method', models.CharField(blank=True, choices=[('bank_transfer', 'Bank Transfer'), ('cash', 'Cash'), ('check', 'Check'), ('online', 'Online Payment'), ('stripe', 'Stripe')], max_length=20, null=True, verbose_name='payment method')),
+                ('transaction_id', models.CharField(blank=True, max_length=100, verbose_name='transaction ID')),
+                ('receipt_number', models.CharField(max_length=50, unique=True, verbose_name='receipt number')),
+                ('late_fee_applied', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=8, verbose_name='late fee applied')),
+                ('notes', models.TextField(blank=True, verbose_name='notes')),
+                ('paid_at', models.DateTimeField(blank=True, null=True, verbose_name='paid at')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('lease', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payments', to='tenants.lease')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rent_payments', to='tenants.tenant')),
+            ],
+            options={
+                'verbose_name': 'Rent Payment',
+                'verbose_name_plural': 'Rent Payments',
+                'db_table': 'rent_payments',
+                'ordering': ['-due_date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='MaintenanceRequest',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255, verbose_name='title')),
+                ('description', models.TextField(verbose_name='description')),
+                ('category', models.CharField(choices=[('plumbing', 'Plumbing'), ('electrical', 'Electrical'), ('hvac', 'HVAC'), ('appliance', 'Appliance'), ('structural', 'Structural'), ('other', 'Other')], max_length=20, verbose_name='category')),
+                ('priority', models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High'), ('urgent', 'Urgent')], default='medium', max_length=20, verbose_name='priority')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], default='pending', max_length=20, verbose_name='status')),
+                ('assigned_to', models.CharField(blank=True, max_length=255, verbose_name='assigned to')),
+                ('estimated_cost', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='estimated cost')),
+                ('actual_cost', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='actual cost')),
+                ('images', models.JSONField(blank=True, default=list, verbose_name='images')),
+                ('scheduled_date', models.DateTimeField(blank=True, null=True, verbose_name='scheduled date')),
+                ('completed_date', models.DateTimeField(blank=True, null=True, verbose_name='completed date')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('lease', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='maintenance_requests', to='tenants.lease')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='maintenance_requests', to='properties.property')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='maintenance_requests', to='tenants.tenant')),
+            ],
+            options={
+                'verbose_name': 'Maintenance Request',
+                'verbose_name_plural': 'Maintenance Requests',
+                'db_table': 'maintenance_requests',
+                'ordering': ['-priority', '-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='lease',
+            name='tenant',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leases', to='tenants.tenant'),
+        ),
+        migrations.CreateModel(
+            name='TenantCommunication',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('communication_type', models.CharField(choices=[('message', 'Message'), ('notice', 'Notice'), ('complaint', 'Complaint'), ('request', 'Request'), ('announcement', 'Announcement')], max_length=20, verbose_name='type')),
+                ('subject', models.CharField(max_length=255, verbose_name='subject')),
+                ('message', models.TextField(verbose_name='message')),
+                ('sender_type', models.CharField(choices=[('tenant', 'Tenant'), ('landlord', 'Landlord')], max_length=10, verbose_name='sender type')),
+                ('is_read', models.BooleanField(default=False, verbose_name='is read')),
+                ('read_at', models.DateTimeField(blank=True, null=True, verbose_name='read at')),
+                ('is_urgent', models.BooleanField(default=False, verbose_name='is urgent')),
+                ('requires_response', models.BooleanField(default=False, verbose_name='requires response')),
+                ('response_due_date', models.DateTimeField(blank=True, null=True, verbose_name='response due date')),
+                ('responded_at', models.DateTimeField(blank=True, null=True, verbose_name='responded at')),
+                ('attachments', models.JSONField(blank=True, default=list, verbose_name='attachments')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('landlord', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tenant_communications', to=settings.AUTH_USER_MODEL)),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tenant_communications', to='properties.property')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='communications', to='tenants.tenant')),
+            ],
+            options={
+                'verbose_name': 'Tenant Communication',
+                'verbose_name_plural': 'Tenant Communications',
+                'db_table': 'tenant_communications',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TenantDocument',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('document_type', models.CharField(choices=[('id', 'ID Document'), ('income', 'Income Proof'), ('employment', 'Employment Letter'), ('reference', 'Reference Letter'), ('bank', 'Bank Statement'), ('other', 'Other')], max_length=20, verbose_name='document type')),
+                ('file', models.FileField(upload_to='tenant_documents/', verbose_name='file')),
+                ('file_name', models.CharField(max_length=255, verbose_name='file name')),
+                ('file_size', models.IntegerField(verbose_name='file size (bytes)')),
+                ('is_verified', models.BooleanField(default=False, verbose_name='is verified')),
+                ('verified_at', models.DateTimeField(blank=True, null=True, verbose_name='verified at')),
+                ('verification_notes', models.TextField(blank=True, verbose_name='verification notes')),
+                ('expires_at', models.DateField(blank=True, null=True, verbose_name='expires at')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tenant_documents', to='tenants.tenant')),
+                ('verified_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='verified_documents', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Tenant Document',
+                'verbose_name_plural': 'Tenant Documents',
+                'db_table': 'tenant_documents',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TenantRating',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tenant_rating', models.IntegerField(blank=True, null=True, verbose_name='tenant rating')),
+                ('tenant_review', models.TextField(blank=True, verbose_name='tenant review')),
+                ('payment_punctuality', models.IntegerField(blank=True, null=True, verbose_name='payment punctuality')),
+                ('property_care', models.IntegerField(blank=True, null=True, verbose_name='property care')),
+                ('communication_rating', models.IntegerField(blank=True, null=True, verbose_name='communication')),
+                ('landlord_rating', models.IntegerField(blank=True, null=True, verbose_name='landlord rating')),
+                ('landlord_review', models.TextField(blank=True, verbose_name='landlord review')),
+                ('responsiveness', models.IntegerField(blank=True, null=True, verbose_name='responsiveness')),
+                ('maintenance_handling', models.IntegerField(blank=True, null=True, verbose_name='maintenance handling')),
+                ('fairness', models.IntegerField(blank=True, null=True, verbose_name='fairness')),
+                ('property_rating', models.IntegerField(blank=True, null=True, verbose_name='property rating')),
+                ('property_review', models.TextField(blank=True, verbose_name='property review')),
+                ('would_rent_again', models.BooleanField(null=True, verbose_name='would rent again')),
+                ('would_recommend', models.BooleanField(null=True, verbose_name='would recommend')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('lease', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='rating', to='tenants.lease')),
+            ],
+            options={
+                'verbose_name': 'Tenant Rating',
+                'verbose_name_plural': 'Tenant Ratings',
+                'db_table': 'tenant_ratings',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['status', 'landlord'], name='tenants_status_9c7ccc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['national_id'], name='tenants_nationa_60c6b9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rentpayment',
+            index=models.Index(fields=['status', 'due_date'], name='rent_paymen_status_876c80_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rentpayment',
+            index=models.Index(fields=['lease', 'tenant'], name='rent_paymen_lease_i_ba5c11_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenancerequest',
+            index=models.Index(fields=['status', 'priority'], name='maintenance_status_317cc0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenancerequest',
+            index=models.Index(fields=['property', 'tenant'], name='maintenance_propert_ae7506_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(fields=['status', 'start_date', 'end_date'], name='leases_status_a9b711_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(fields=['lease_number'], name='leases_lease_n_ea7c18_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenantcommunication',
+            index=models.Index(fields=['tenant', 'is_read'], name='tenant_comm_tenant__f5fc9b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenantcommunication',
+            index=models.Index(fields=['landlord', 'is_read'], name='tenant_comm_landlor_f32b3e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenantcommunication',
+            index=models.Index(fields=['is_urgent', '-created_at'], name='tenant_comm_is_urge_da42da_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenantdocument',
+            index=models.Index(fields=['tenant', 'document_type'], name='tenant_docu_tenant__3826ab_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenantdocument',
+            index=models.Index(fields=['expires_at'], name='tenant_docu_expires_cb2d0e_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(fields=['landlord', 'status'], name='leases_landlor_0cb2ff_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(fields=['landlord', 'property', 'status'], name='leases_landlor_0506b4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rentpayment',
+            index=models.Index(fields=['lease', 'status', 'due_date'], name='rent_paymen_lease_i_eb1f55_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rentpayment',
+            index=models.Index(fields=['status', 'paid_at'], name='rent_paymen_status_7c225d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenancerequest',
+            index=models.Index(fields=['property', 'status', 'priority'], name='maintenance_propert_2740f8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['landlord', '-created_at'], name='tenants_landlor_5f2a67_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('first_name'), name='gin_trgm_ops'), django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('last_name'), name='gin_trgm_ops'), django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('email'), name='gin_trgm_ops'), django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('phone'), name='gin_trgm_ops'), django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('national_id'), name='gin_trgm_ops'), django.contrib.postgres.indexes.OpClass('first_name', name='gin_trgm_ops'), django.contrib.postgres.indexes.OpClass('last_name', name='gin_trgm_ops'), name='tenant_trgm'),
+        ),
+        migrations.AddConstraint(
+            model_name='rentpayment',
+            constraint=models.CheckConstraint(condition=models.Q(('amount_paid__gte', 0)), name='rent_amount_paid_non_negative'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+import datetime
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+def total_this_months_payments(apps, schema_editor):
+    # Same window as apply_payment: fully paid payments with paid_at in the current UTC month
+    Lease = apps.get_model('tenants', 'Lease')
+    RentPayment = apps.get_model('tenants', 'RentPayment')
+    month = timezone.now().date().replace(day=1)
+    month_start = datetime.datetime.combine(month, datetime.time.min, tzinfo=datetime.timezone.utc)
+    paid = RentPayment.objects.filter(
+        lease=models.OuterRef('pk'), status='paid', paid_at__gte=month_start
+    ).order_by().values('lease').annotate(total=models.Sum('amount_paid')).values('total')
+    Lease.objects.update(
+        total_paid_current_month=Coalesce(models.Subquery(paid[:1]), Decimal('0.00')),
+        total_paid_month=month
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0003_tenant_schema'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lease',
+            name='total_paid_current_month',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12, verbose_name='total paid current month'),
+        ),
+        migrations.AddField(
+            model_name='lease',
+            name='total_paid_month',
+            field=models.DateField(blank=True, editable=False, null=True, verbose_name='total paid month'),
+        ),
+        migrations.RunPython(total_this_months_payments, migrations.RunPython.noop),
+    ]
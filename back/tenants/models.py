@@ -1,10 +1,14 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 from django.utils import timezone
 import uuid
 from decimal import Decimal
 
+TENANT_SEARCH_FIELDS = ('first_name', 'last_name', 'email', 'phone', 'national_id')
+
 
 class Tenant(models.Model):
     """Tenant model for property rentals."""
@@ -48,6 +52,16 @@ class Tenant(models.Model):
         indexes = [
             models.Index(fields=['status', 'landlord']),
             models.Index(fields=['national_id']),
+            models.Index(fields=['landlord', '-created_at']),
+            # Serves tenant search: icontains compiles to UPPER(col::text) LIKE, so
+            # every column is indexed under UPPER(); the bare name columns back the
+            # trigram word-similarity (%>) match on names
+            GinIndex(
+                *[OpClass(Upper(field), name='gin_trgm_ops') for field in TENANT_SEARCH_FIELDS],
+                OpClass('first_name', name='gin_trgm_ops'),
+                OpClass('last_name', name='gin_trgm_ops'),
+                name='tenant_trgm',
+            ),
         ]
     
     def get_full_name(self):
@@ -91,6 +105,10 @@ class Lease(models.Model):
     late_fee = models.DecimalField(_('late fee'), max_digits=8, decimal_places=2, default=Decimal('0.00'))
     grace_period_days = models.IntegerField(_('grace period days'), default=5)
     
+    # Running total maintained by record payment; only counts while total_paid_month is the current month
+    total_paid_current_month = models.DecimalField(_('total paid current month'), max_digits=12, decimal_places=2, default=Decimal('0.00'))
+    total_paid_month = models.DateField(_('total paid month'), null=True, blank=True, editable=False)
+    
     terms_conditions = models.TextField(_('terms and conditions'), blank=True)
     special_conditions = models.TextField(_('special conditions'), blank=True)
     auto_renew = models.BooleanField(_('auto renew'), default=False)
@@ -109,6 +127,8 @@ class Lease(models.Model):
         indexes = [
             models.Index(fields=['status', 'start_date', 'end_date']),
             models.Index(fields=['lease_number']),
+            models.Index(fields=['landlord', 'status']),
+            models.Index(fields=['landlord', 'property', 'status']),
         ]
     
     def save(self, *args, **kwargs):
@@ -173,6 +193,11 @@ class RentPayment(models.Model):
         indexes = [
             models.Index(fields=['status', 'due_date']),
             models.Index(fields=['lease', 'tenant']),
+            models.Index(fields=['lease', 'status', 'due_date']),
+            models.Index(fields=['status', 'paid_at']),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(amount_paid__gte=0), name='rent_amount_paid_non_negative'),
         ]
     
     def save(self, *args, **kwargs):
@@ -241,6 +266,7 @@ class MaintenanceRequest(models.Model):
         indexes = [
             models.Index(fields=['status', 'priority']),
             models.Index(fields=['property', 'tenant']),
+            models.Index(fields=['property', 'status', 'priority']),
         ]
     
     def __str__(self):
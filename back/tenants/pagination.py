@@ -0,0 +1,14 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class StandardPagination(PageNumberPagination):
+    """Page number pagination applied at the database (LIMIT/OFFSET)."""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class TenantCursorPagination(CursorPagination):
+    """Keyset pagination on created_at; avoids the COUNT(*) per page."""
+    ordering = '-created_at'
+    page_size = 20
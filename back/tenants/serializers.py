@@ -18,12 +18,15 @@ class TenantSerializer(serializers.ModelSerializer):
             'monthly_income', 'emergency_contact', 'status', 'credit_score',
             'documents', 'notes', 'active_lease_count', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'landlord', 'created_at', 'updated_at']
     
     def get_full_name(self, obj):
         return obj.get_full_name()
     
     def get_active_lease_count(self, obj):
+        # Annotated by the tenant views; fall back to a query otherwise
+        if hasattr(obj, 'active_leases_total'):
+            return obj.active_leases_total
         return obj.leases.filter(status='active').count()
 
 
@@ -42,7 +45,7 @@ class LeaseSerializer(serializers.ModelSerializer):
             'special_conditions', 'auto_renew', 'contract_document',
             'signed_date', 'is_active', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'lease_number', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'landlord', 'lease_number', 'created_at', 'updated_at']
     
     def get_is_active(self, obj):
         return obj.is_active()
@@ -12,6 +12,7 @@ urlpatterns = [
     
     path('payments/', views.rent_payments, name='rent_payments'),
     path('payments/<uuid:pk>/record/', views.record_payment, name='record_payment'),
+    path('payments/record/batch/', views.RentPaymentBatchRecordAPIView.as_view(), name='record_payments_batch'),
     
     path('maintenance/', views.maintenance_requests, name='maintenance_requests'),
     path('maintenance/<uuid:pk>/update/', views.update_maintenance_request, name='update_maintenance_request'),
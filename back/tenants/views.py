@@ -1,27 +1,78 @@
+from adrf import generics as async_generics
+from asgiref.sync import sync_to_async
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Sum, Count, Avg
+from django.db import transaction
+from django.core.cache import cache
+from django.db.models import (
+    Q, F, Sum, Count, Avg, Case, When, Value,
+    BooleanField, DurationField, ExpressionWrapper, IntegerField
+)
+from django.db.models.functions import Concat, ExtractDay, Now
+from django.http import Http404
 from django.utils import timezone
-from datetime import timedelta
+from decimal import Decimal, InvalidOperation
+import os
+import uuid
 from .models import (
     Tenant, Lease, RentPayment, MaintenanceRequest,
     TenantDocument, TenantCommunication, TenantRating
 )
+from .pagination import StandardPagination, TenantCursorPagination
 from .serializers import (
     TenantSerializer, LeaseSerializer, RentPaymentSerializer,
     MaintenanceRequestSerializer, TenantDocumentSerializer,
     TenantCommunicationSerializer, TenantRatingSerializer
 )
 
+DASHBOARD_CACHE_TIMEOUT = 60
+
+
+def dashboard_cache_key(user_id):
+    return f'tenant_dashboard_{user_id}'
+
+
+def invalidate_dashboard_cache(*user_ids):
+    """Drop cached dashboards for the given users."""
+    cache.delete_many([dashboard_cache_key(user_id) for user_id in user_ids if user_id])
+
+
+class ValuesListMixin:
+    """Serve GET lists as plain dicts from .values(); writes still use the serializer."""
+    list_fields = ()
+    
+    def get_list_expressions(self):
+        return {}
+    
+    @staticmethod
+    def format_row(row):
+        # Money goes out as strings, matching the serializers' DecimalField output
+        return {
+            key: str(value) if isinstance(value, Decimal) else value
+            for key, value in row.items()
+        }
+    
+    async def alist(self, request, *args, **kwargs):
+        queryset = await self.afilter_queryset(self.get_queryset())
+        queryset = queryset.values(*self.list_fields, **self.get_list_expressions())
+        
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return await self.get_apaginated_response([self.format_row(row) for row in page])
+        
+        rows = await sync_to_async(list)(queryset)
+        return Response([self.format_row(row) for row in rows])
+
 
 # Tenant Views
-class TenantListCreateAPIView(generics.ListCreateAPIView):
+class TenantListCreateAPIView(async_generics.ListCreateAPIView):
     """List all tenants or create a new tenant."""
     serializer_class = TenantSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = TenantCursorPagination
     
     def get_queryset(self):
         queryset = Tenant.objects.filter(landlord=self.request.user)
@@ -33,18 +84,25 @@ class TenantListCreateAPIView(generics.ListCreateAPIView):
         if status:
             queryset = queryset.filter(status=status)
         if search:
+            # Substring match on every column, plus typo-tolerant word similarity
+            # on names; all branches are served by the tenant_trgm GIN index
             queryset = queryset.filter(
-                Q(first_name__icontains=search) |
-                Q(last_name__icontains=search) |
+                Q(first_name__icontains=search) | Q(first_name__trigram_word_similar=search) |
+                Q(last_name__icontains=search) | Q(last_name__trigram_word_similar=search) |
                 Q(email__icontains=search) |
                 Q(phone__icontains=search) |
                 Q(national_id__icontains=search)
             )
         
-        return queryset.order_by('-created_at')
+        return queryset.annotate(
+            active_leases_total=Count('leases', filter=Q(leases__status='active'))
+        )
     
     def perform_create(self, serializer):
         serializer.save(landlord=self.request.user)
+    
+    async def perform_acreate(self, serializer):
+        await sync_to_async(self.perform_create)(serializer)
 
 
 class TenantRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
@@ -53,14 +111,17 @@ class TenantRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        return Tenant.objects.filter(landlord=self.request.user)
+        return Tenant.objects.filter(landlord=self.request.user).annotate(
+            active_leases_total=Count('leases', filter=Q(leases__status='active'))
+        )
 
 
 # Lease Views
-class LeaseListCreateAPIView(generics.ListCreateAPIView):
+class LeaseListCreateAPIView(async_generics.ListCreateAPIView):
     """List all leases or create a new lease."""
     serializer_class = LeaseSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = StandardPagination
     
     def get_queryset(self):
         queryset = Lease.objects.filter(landlord=self.request.user)
@@ -77,28 +138,29 @@ class LeaseListCreateAPIView(generics.ListCreateAPIView):
         if tenant_id:
             queryset = queryset.filter(tenant_id=tenant_id)
         
-        return queryset.select_related('property', 'tenant').order_by('-created_at')
+        # property_details renders PropertyListSerializer (needs the owner name)
+        return queryset.select_related('property__owner', 'tenant').order_by('-created_at')
     
     def perform_create(self, serializer):
         lease = serializer.save(landlord=self.request.user)
         
         # Create initial rent payments
         self._create_rent_payments(lease)
+        
+        invalidate_dashboard_cache(lease.landlord_id, lease.tenant.user_id)
+    
+    async def perform_acreate(self, serializer):
+        await sync_to_async(self.perform_create)(serializer)
     
     def _create_rent_payments(self, lease):
         """Create rent payment records based on lease terms."""
         from dateutil.relativedelta import relativedelta
         
+        due_dates = []
         current_date = lease.start_date
         
         while current_date <= lease.end_date:
-            RentPayment.objects.create(
-                lease=lease,
-                tenant=lease.tenant,
-                amount_due=lease.monthly_rent,
-                due_date=current_date,
-                payment_date=None
-            )
+            due_dates.append(current_date)
             
             # Calculate next payment date
             if lease.payment_frequency == 'monthly':
@@ -111,6 +173,21 @@ class LeaseListCreateAPIView(generics.ListCreateAPIView):
                 current_date += relativedelta(years=1)
             else:
                 break
+        
+        # One urandom read for every receipt number instead of a uuid4() per row
+        raw = os.urandom(4 * len(due_dates))
+        
+        RentPayment.objects.bulk_create([
+            RentPayment(
+                lease=lease,
+                tenant_id=lease.tenant_id,
+                amount_due=lease.monthly_rent,
+                due_date=due_date,
+                payment_date=None,
+                receipt_number=f"RCP-{raw[i * 4:(i + 1) * 4].hex().upper()}"
+            )
+            for i, due_date in enumerate(due_dates)
+        ])
 
 
 class LeaseRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
@@ -119,14 +196,34 @@ class LeaseRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        return Lease.objects.filter(landlord=self.request.user)
+        return Lease.objects.filter(landlord=self.request.user).select_related(
+            'property__owner', 'tenant'
+        )
 
 
 # Rent Payment Views
-class RentPaymentListAPIView(generics.ListAPIView):
+class RentPaymentListAPIView(ValuesListMixin, async_generics.ListAPIView):
     """List rent payments."""
     serializer_class = RentPaymentSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = StandardPagination
+    list_fields = (
+        'id', 'lease', 'tenant', 'amount_due', 'amount_paid', 'payment_date',
+        'due_date', 'status', 'payment_method', 'transaction_id',
+        'receipt_number', 'late_fee_applied', 'notes', 'paid_at',
+        'created_at', 'updated_at'
+    )
+    
+    def get_list_expressions(self):
+        return {
+            'lease_number': F('lease__lease_number'),
+            'property_title': F('lease__property__title'),
+            'tenant_name': Concat('tenant__first_name', Value(' '), 'tenant__last_name'),
+            'is_overdue': ExpressionWrapper(
+                Q(status='pending', due_date__lt=timezone.now().date()),
+                output_field=BooleanField()
+            ),
+        }
     
     def get_queryset(self):
         queryset = RentPayment.objects.filter(lease__landlord=self.request.user)
@@ -153,16 +250,75 @@ class RentPaymentListAPIView(generics.ListAPIView):
         return queryset.select_related('lease', 'tenant').order_by('-due_date')
 
 
+# Bounds of RentPayment.amount_paid (max_digits=10, decimal_places=2)
+AMOUNT_STEP = Decimal('0.01')
+MAX_AMOUNT = Decimal('99999999.99')
+
+
+def parse_amount(value):
+    """Return value as a Decimal that fits amount_paid, or None."""
+    try:
+        amount = Decimal(str(value))
+        if not amount.is_finite() or not 0 <= amount <= MAX_AMOUNT:
+            return None
+        quantized = amount.quantize(AMOUNT_STEP)
+    except InvalidOperation:
+        return None
+    # Reject sub-cent input rather than silently rounding money
+    return quantized if quantized == amount else None
+
+
+def apply_payment(payment, amount_paid, payment_method, transaction_id, now):
+    """
+    Set the recorded fields on a locked payment and return the change
+    to its lease's total_paid_current_month.
+    """
+    # The running total only holds payments fully paid this month, as the
+    # dashboard's monthly revenue always has
+    previous_amount = payment.amount_paid if (
+        payment.status == 'paid' and payment.paid_at and
+        (payment.paid_at.year, payment.paid_at.month) == (now.year, now.month)
+    ) else Decimal('0.00')
+    
+    payment.amount_paid = amount_paid
+    payment.payment_method = payment_method
+    payment.transaction_id = transaction_id
+    payment.paid_at = now
+    payment.payment_date = now.date()
+    
+    # Lateness and late fees are applied by the mark_late_payments command
+    payment.status = 'paid' if amount_paid >= payment.amount_due else 'partial'
+    
+    current_amount = amount_paid if payment.status == 'paid' else Decimal('0.00')
+    return current_amount - previous_amount
+
+
+def add_to_month_total(lease_id, paid_delta, now):
+    """Add paid_delta to the lease's running total, starting over when it belongs to an earlier month."""
+    month = now.date().replace(day=1)
+    Lease.objects.filter(pk=lease_id).update(
+        total_paid_current_month=Case(
+            When(total_paid_month=month, then=F('total_paid_current_month') + paid_delta),
+            default=Value(paid_delta)
+        ),
+        total_paid_month=month
+    )
+
+
+RECORDED_PAYMENT_FIELDS = [
+    'amount_paid', 'payment_method', 'transaction_id', 'paid_at',
+    'payment_date', 'status', 'updated_at'
+]
+
+
 class RentPaymentRecordAPIView(APIView):
     """Record a rent payment."""
     permission_classes = [IsAuthenticated]
     
     def post(self, request, pk):
-        payment = get_object_or_404(RentPayment, pk=pk, lease__landlord=request.user)
-        
         amount_paid = request.data.get('amount_paid')
         payment_method = request.data.get('payment_method')
-        transaction_id = request.data.get('transaction_id')
+        transaction_id = request.data.get('transaction_id', '')
         
         if not amount_paid:
             return Response(
@@ -170,38 +326,129 @@ class RentPaymentRecordAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        payment.amount_paid = amount_paid
-        payment.payment_method = payment_method
-        payment.transaction_id = transaction_id
-        payment.paid_at = timezone.now()
-        payment.payment_date = timezone.now().date()
-        
-        # Update status
-        if float(amount_paid) >= float(payment.amount_due):
-            payment.status = 'paid'
-        else:
-            payment.status = 'partial'
+        amount_paid = parse_amount(amount_paid)
+        if amount_paid is None:
+            return Response(
+                {'error': 'Amount paid must be between 0 and 99999999.99 with at most two decimal places'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # Check if late
-        if payment.due_date < timezone.now().date():
-            payment.status = 'late'
-            # Apply late fee if configured
-            if payment.lease.late_fee > 0:
-                grace_period_end = payment.due_date + timedelta(days=payment.lease.grace_period_days)
-                if timezone.now().date() > grace_period_end:
-                    payment.late_fee_applied = payment.lease.late_fee
+        with transaction.atomic():
+            # Lock only the payment row; lease and tenant are joined for reading
+            payment = get_object_or_404(
+                RentPayment.objects.select_related('lease', 'tenant').select_for_update(of=('self',)),
+                pk=pk,
+                lease__landlord=request.user
+            )
+            
+            now = timezone.now()
+            paid_delta = apply_payment(payment, amount_paid, payment_method, transaction_id, now)
+            payment.save(update_fields=RECORDED_PAYMENT_FIELDS)
+            
+            add_to_month_total(payment.lease_id, paid_delta, now)
         
-        payment.save()
+        invalidate_dashboard_cache(payment.lease.landlord_id, payment.tenant.user_id)
         
         serializer = RentPaymentSerializer(payment)
         return Response(serializer.data)
 
 
+class RentPaymentBatchRecordAPIView(APIView):
+    """Record several rent payments in one request."""
+    permission_classes = [IsAuthenticated]
+    max_batch_size = 500
+    
+    def post(self, request):
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response(
+                {'error': 'Expected a non-empty list of payments'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > self.max_batch_size:
+            return Response(
+                {'error': f'At most {self.max_batch_size} payments can be recorded per request'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        entries = {}
+        for item in items:
+            try:
+                pk = uuid.UUID(str(item['pk']))
+                amount_paid = parse_amount(item['amount_paid']) if item['amount_paid'] else None
+            except (TypeError, KeyError, ValueError):
+                pk = amount_paid = None
+            if amount_paid is None:
+                return Response(
+                    {'error': 'Each payment needs a pk and an amount_paid between 0 and 99999999.99 with at most two decimal places', 'item': item},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            entries[str(pk)] = (amount_paid, item.get('payment_method'), item.get('transaction_id', ''))
+        
+        with transaction.atomic():
+            # Locking in pk order keeps overlapping batches from deadlocking
+            payments = list(
+                RentPayment.objects.select_related('lease__property', 'tenant')
+                .select_for_update(of=('self',))
+                .filter(pk__in=list(entries), lease__landlord=request.user)
+                .order_by('pk')
+            )
+            missing = set(entries) - {str(payment.pk) for payment in payments}
+            if missing:
+                return Response(
+                    {'error': 'Payments not found', 'missing': sorted(missing)},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            
+            now = timezone.now()
+            lease_deltas = {}
+            for payment in payments:
+                paid_delta = apply_payment(payment, *entries[str(payment.pk)], now)
+                payment.updated_at = now
+                lease_deltas[payment.lease_id] = lease_deltas.get(payment.lease_id, Decimal('0.00')) + paid_delta
+            
+            RentPayment.objects.bulk_update(payments, RECORDED_PAYMENT_FIELDS, batch_size=500)
+            
+            for lease_id, paid_delta in lease_deltas.items():
+                add_to_month_total(lease_id, paid_delta, now)
+        
+        invalidate_dashboard_cache(
+            request.user.id, *{payment.tenant.user_id for payment in payments}
+        )
+        
+        serializer = RentPaymentSerializer(payments, many=True)
+        return Response(serializer.data)
+
+
 # Maintenance Request Views
-class MaintenanceRequestListCreateAPIView(generics.ListCreateAPIView):
+class MaintenanceRequestListCreateAPIView(ValuesListMixin, async_generics.ListCreateAPIView):
     """List maintenance requests or create a new one."""
     serializer_class = MaintenanceRequestSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = StandardPagination
+    list_fields = (
+        'id', 'property', 'tenant', 'lease', 'title', 'description',
+        'category', 'priority', 'status', 'assigned_to', 'estimated_cost',
+        'actual_cost', 'images', 'scheduled_date', 'completed_date',
+        'created_at', 'updated_at'
+    )
+    
+    def get_list_expressions(self):
+        return {
+            'property_title': F('property__title'),
+            'tenant_name': Concat('tenant__first_name', Value(' '), 'tenant__last_name'),
+            'days_open': Case(
+                When(status__in=['completed', 'cancelled'], then=Value(None)),
+                default=ExtractDay(ExpressionWrapper(Now() - F('created_at'), output_field=DurationField())),
+                output_field=IntegerField()
+            ),
+        }
+    
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # Resolve the reverse tenant_profile lookup here (off the event loop)
+        # so get_queryset() only reads the cached relation.
+        hasattr(request.user, 'tenant_profile')
     
     def get_queryset(self):
         user = self.request.user
@@ -243,6 +490,9 @@ class MaintenanceRequestListCreateAPIView(generics.ListCreateAPIView):
             notification_type='maintenance',
             metadata={'request_id': str(instance.id)}
         )
+    
+    async def perform_acreate(self, serializer):
+        await sync_to_async(self.perform_create)(serializer)
 
 
 class MaintenanceRequestRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
@@ -258,13 +508,48 @@ class MaintenanceRequestRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
             return MaintenanceRequest.objects.filter(property__owner=user)
     
     def update(self, request, *args, **kwargs):
+        # Status-only PATCHes skip the serializer round trip
+        if set(request.data.keys()) == {'status'}:
+            return self.update_status(request.data['status'])
+        
         instance = self.get_object()
         
         # Set completed date if status is being changed to completed
         if request.data.get('status') == 'completed' and instance.status != 'completed':
             request.data['completed_date'] = timezone.now()
         
-        return super().update(request, *args, **kwargs)
+        response = super().update(request, *args, **kwargs)
+        invalidate_dashboard_cache(instance.property.owner_id, instance.tenant.user_id)
+        return response
+    
+    def update_status(self, new_status):
+        """Change the status with a single UPDATE statement."""
+        if new_status not in dict(MaintenanceRequest.STATUS_CHOICES):
+            return Response(
+                {'error': 'Invalid status'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        now = timezone.now()
+        completed_date = F('completed_date')
+        if new_status == 'completed':
+            # Only stamp requests that were not already completed
+            completed_date = Case(
+                When(~Q(status='completed'), then=Value(now)),
+                default=F('completed_date')
+            )
+        
+        queryset = self.get_queryset().filter(pk=self.kwargs[self.lookup_field])
+        updated = queryset.update(status=new_status, completed_date=completed_date, updated_at=now)
+        if not updated:
+            raise Http404
+        
+        data = queryset.values(
+            'id', 'status', 'completed_date', 'updated_at',
+            'property__owner_id', 'tenant__user_id'
+        ).get()
+        invalidate_dashboard_cache(data.pop('property__owner_id'), data.pop('tenant__user_id'))
+        return Response(data)
 
 
 # Tenant Document Views
@@ -493,23 +778,26 @@ class TenantDashboardAPIView(APIView):
     permission_classes = [IsAuthenticated]
     
     def get(self, request):
-        user = request.user
+        cache_key = dashboard_cache_key(request.user.id)
+        data = cache.get(cache_key)
+        
+        if data is None:
+            data = self.get_dashboard_data(request.user)
+            cache.set(cache_key, data, DASHBOARD_CACHE_TIMEOUT)
         
+        return Response(data)
+    
+    def get_dashboard_data(self, user):
         # For landlords
         if not hasattr(user, 'tenant_profile'):
             tenants_count = Tenant.objects.filter(landlord=user).count()
             active_leases = Lease.objects.filter(landlord=user, status='active').count()
             
-            # Revenue statistics
-            current_month = timezone.now().month
-            current_year = timezone.now().year
-            
-            monthly_revenue = RentPayment.objects.filter(
-                lease__landlord=user,
-                status='paid',
-                paid_at__month=current_month,
-                paid_at__year=current_year
-            ).aggregate(total=Sum('amount_paid'))['total'] or 0
+            # Revenue statistics, summed from the per-lease running totals of this month
+            monthly_revenue = Lease.objects.filter(
+                landlord=user,
+                total_paid_month=timezone.now().date().replace(day=1)
+            ).aggregate(total=Sum('total_paid_current_month'))['total'] or 0
             
             pending_payments = RentPayment.objects.filter(
                 lease__landlord=user,
@@ -537,7 +825,7 @@ class TenantDashboardAPIView(APIView):
             ).aggregate(
                 total_due=Sum('amount_due'),
                 total_collected=Sum('amount_paid'),
-                on_time_payments=Count('id', filter=Q(status='paid', paid_at__lte=models.F('due_date')))
+                on_time_payments=Count('id', filter=Q(status='paid', paid_at__lte=F('due_date')))
             )
             
             collection_rate = (
@@ -545,7 +833,7 @@ class TenantDashboardAPIView(APIView):
                 if payment_stats['total_due'] else 0
             )
             
-            return Response({
+            return {
                 'landlord_dashboard': {
                     'tenants_count': tenants_count,
                     'active_leases': active_leases,
@@ -558,7 +846,7 @@ class TenantDashboardAPIView(APIView):
                     'collection_rate': round(collection_rate, 2),
                     'payment_performance': payment_stats
                 }
-            })
+            }
         
         # For tenants
         else:
@@ -589,12 +877,12 @@ class TenantDashboardAPIView(APIView):
                 on_time_payments = RentPayment.objects.filter(
                     tenant=tenant,
                     status='paid',
-                    paid_at__lte=models.F('due_date')
+                    paid_at__lte=F('due_date')
                 ).count()
                 
                 payment_score = (on_time_payments / total_payments * 100) if total_payments > 0 else 100
                 
-                return Response({
+                return {
                     'tenant_dashboard': {
                         'active_lease': LeaseSerializer(active_lease).data if active_lease else None,
                         'upcoming_payments': RentPaymentSerializer(upcoming_payments, many=True).data,
@@ -607,10 +895,10 @@ class TenantDashboardAPIView(APIView):
                             sender_type='landlord'
                         ).count()
                     }
-                })
+                }
             
-            return Response({
+            return {
                 'tenant_dashboard': {
                     'message': 'No active lease found'
                 }
-            })
\ No newline at end of file
+            }
\ No newline at end of file